@@ -0,0 +1,45 @@
+"""
+Database Connection Module
+
+This module owns the single SQLite connection to db/users.db that every window
+shares. The connection is opened once, tuned with WAL journaling and related
+pragmas, and closed when the process exits.
+
+SQLite allows one writer at a time, so code that writes should hold write_lock
+for the duration of its transaction.
+"""
+
+import atexit
+import sqlite3
+import threading
+from functools import lru_cache
+
+DB_PATH = "db/users.db"
+
+# Serialises write transactions on the shared connection
+write_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_conn():
+    """
+    Get the process-wide connection to the users database.
+
+    Returns:
+        sqlite3.Connection: The shared, pragma-tuned connection
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    atexit.register(_close, conn)
+    return conn
+
+
+def _close(conn):
+    try:
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
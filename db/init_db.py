@@ -1,20 +1,53 @@
 import sqlite3
 import os
+from db.connection import get_conn, write_lock
+from db.search_index import create_schema
+
+USERS_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS users (
+        username TEXT PRIMARY KEY,
+        password_hash TEXT NOT NULL,
+        salt TEXT NOT NULL,
+        kdf TEXT NOT NULL DEFAULT 'sha256',
+        key_hash TEXT
+    ) WITHOUT ROWID
+'''
+
+def migrate_users_table(cursor, columns):
+    """
+    Rebuild a users table created with the old rowid schema.
+
+    The old table had an unused integer id and, before Argon2, no kdf column.
+    Rows are copied into a WITHOUT ROWID table keyed by username so the login
+    lookup is a single primary-key B-tree search.
+    """
+    kdf = "kdf" if "kdf" in columns else "'sha256'"
+    cursor.execute("BEGIN")
+    cursor.execute("ALTER TABLE users RENAME TO users_legacy")
+    cursor.execute(USERS_SCHEMA)
+    cursor.execute(f"INSERT INTO users (username, password_hash, salt, kdf) "
+                   f"SELECT username, password_hash, salt, {kdf} FROM users_legacy")
+    cursor.execute("DROP TABLE users_legacy")
 
 def init_db():
     os.makedirs("db", exist_ok=True)
-    conn = sqlite3.connect("db/users.db")
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            salt TEXT NOT NULL
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    conn = get_conn()
+    with write_lock, conn:
+        cursor = conn.cursor()
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(users)")]
+        if "id" in columns:
+            migrate_users_table(cursor, columns)
+        else:
+            cursor.execute(USERS_SCHEMA)
+            if columns and "key_hash" not in columns:
+                # Entry keys keep coming from password_hash until the password changes
+                cursor.execute("ALTER TABLE users ADD COLUMN key_hash TEXT")
+    with write_lock, conn:
+        try:
+            create_schema(conn.cursor())
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; advanced search scans metadata files instead
+            pass
 
 if __name__ == "__main__":
     init_db()
@@ -0,0 +1,244 @@
+"""
+Entry Search Index Module
+
+This module maintains an SQLite FTS5 index over entry metadata so that
+AdvancedSearchWindow can answer keyword, tag and date queries, and the editor can
+list known tags, with a single query instead of opening and parsing every
+.meta.json file.
+
+Entries are indexed when the editor saves them. Each row also records the size
+and modification time of the metadata file it was read from, and before every
+query the user's metadata files are checked against them, as MetaCache does:
+files written elsewhere (for example by add_search_fields or outside the app)
+are indexed again and rows for removed files are dropped. If the SQLite build
+lacks FTS5, every function here reports the index as unavailable and callers
+scan the files instead.
+"""
+
+import os
+import sqlite3
+from collections import Counter
+
+from db.connection import get_conn, write_lock
+from utils.jsonio import load_files
+from utils.entries import iter_entry_files, entry_date, add_search_fields, META_SUFFIX, ENC_SUFFIX
+
+# Separates the lower-cased tags in the tags_ci column; a tag is matched whole
+# by searching for it between two separators
+TAG_SEP = "\x1f"
+
+# Trigram MATCH needs at least this many characters; shorter terms are only
+# checked by the substring filter
+_TRIGRAM_MIN = 3
+
+
+def create_schema(cursor):
+    """
+    Create the FTS5 table if it does not exist.
+
+    The searchable columns hold the lower-cased copies of the title, preview and
+    tags that the metadata scan compares against, indexed by trigrams so that a
+    keyword matches any substring, exactly as the scan does. An index built with
+    an older layout is dropped, and every user's entries are indexed again on
+    their next search.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor on the users database
+
+    Raises:
+        sqlite3.OperationalError: If this SQLite build has no FTS5 support
+    """
+    columns = [row[1] for row in cursor.execute("PRAGMA table_info(entries_fts)")]
+    if columns and "meta_mtime" not in columns:
+        cursor.execute("DROP TABLE entries_fts")
+    # Older layouts tracked indexed users in a separate table; rows now carry a stat
+    cursor.execute("DROP TABLE IF EXISTS entries_fts_users")
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+            title_ci, preview_ci, tags_ci,
+            title UNINDEXED, tags UNINDEXED, date UNINDEXED, path UNINDEXED,
+            username UNINDEXED, has_image UNINDEXED, meta_mtime UNINDEXED, meta_size UNINDEXED,
+            tokenize='trigram case_sensitive 1'
+        )
+    ''')
+
+
+def _row(username, enc_path, meta, st):
+    # Use the same lower-cased fields as the metadata scan, without touching the caller's dict
+    meta = dict(meta)
+    add_search_fields(meta)
+    tags_ci = meta["tags_ci"]
+    return (
+        meta["title_ci"],
+        meta["preview_ci"],
+        TAG_SEP + TAG_SEP.join(tags_ci) + TAG_SEP if tags_ci else "",
+        meta.get("title", "Untitled Entry"),
+        ", ".join(meta.get("tags", [])),
+        entry_date(meta),
+        enc_path,
+        username,
+        1 if meta.get("has_image", False) else 0,
+        # A missing stat never matches a file, so the row is read again
+        st.st_mtime_ns if st else None,
+        st.st_size if st else None,
+    )
+
+
+def _insert(cursor, username, enc_path, meta, st):
+    cursor.execute("DELETE FROM entries_fts WHERE path = ?", (enc_path,))
+    cursor.execute(
+        "INSERT INTO entries_fts (title_ci, preview_ci, tags_ci, title, tags, date, path, "
+        "username, has_image, meta_mtime, meta_size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        _row(username, enc_path, meta, st),
+    )
+
+
+def index_entry(username, enc_path, meta):
+    """
+    Add or replace the index row for a saved entry.
+
+    Args:
+        username (str): The entry's owner
+        enc_path (str): Path to the encrypted entry file
+        meta (dict): The metadata written alongside the entry
+    """
+    try:
+        st = os.stat(enc_path[:-len(ENC_SUFFIX)] + META_SUFFIX)
+    except OSError:
+        st = None
+    conn = get_conn()
+    try:
+        with write_lock, conn:
+            _insert(conn.cursor(), username, enc_path, meta, st)
+    except sqlite3.OperationalError:
+        # No FTS5 support; searches fall back to scanning metadata files
+        pass
+
+
+def remove_entry(enc_path):
+    """
+    Drop the index row for a deleted entry.
+
+    Args:
+        enc_path (str): Path to the encrypted entry file
+    """
+    conn = get_conn()
+    try:
+        with write_lock, conn:
+            conn.execute("DELETE FROM entries_fts WHERE path = ?", (enc_path,))
+    except sqlite3.OperationalError:
+        pass
+
+
+def _ensure_indexed(cursor, username, entry_dir):
+    # Bring the user's rows in line with their metadata files, re-reading only
+    # the files whose size or modification time differ from the indexed copy
+    cursor.execute("SELECT path, meta_mtime, meta_size FROM entries_fts WHERE username = ?",
+                   (username,))
+    indexed = {path: (mtime, size) for path, mtime, size in cursor.fetchall()}
+    stale = []
+    for entry in iter_entry_files(entry_dir):
+        if not entry.name.endswith(META_SUFFIX):
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        enc_path = entry.path[:-len(META_SUFFIX)] + ENC_SUFFIX
+        if indexed.pop(enc_path, None) != (st.st_mtime_ns, st.st_size):
+            stale.append((enc_path, st))
+    for (enc_path, st), (_, meta) in zip(stale, load_files(
+            [enc_path[:-len(ENC_SUFFIX)] + META_SUFFIX for enc_path, _ in stale])):
+        if meta is None:
+            # Unreadable metadata is skipped by the scan too
+            indexed[enc_path] = None
+        else:
+            _insert(cursor, username, enc_path, meta, st)
+    # Whatever is left was deleted, moved or became unreadable
+    for enc_path in indexed:
+        cursor.execute("DELETE FROM entries_fts WHERE path = ?", (enc_path,))
+
+
+def tag_counts(username, entry_dir):
+    """
+    Count how many of a user's entries carry each tag.
+
+    Args:
+        username (str): The user whose entries are read
+        entry_dir (str): The user's entry directory, re-checked before the query
+
+    Returns:
+        Counter or None: Entries per tag, or None if the index is unavailable
+    """
+    conn = get_conn()
+    try:
+        with write_lock, conn:
+            _ensure_indexed(conn.cursor(), username, entry_dir)
+        rows = conn.execute("SELECT tags FROM entries_fts WHERE username = ? AND tags != ''",
+                            (username,)).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    counts = Counter()
+    for (tags,) in rows:
+        counts.update(tags.split(", "))
+    return counts
+
+
+def _phrase(text):
+    # Quote user input so FTS5 treats it as a phrase, not query syntax
+    return '"' + text.replace('"', '""') + '"'
+
+
+def search(username, entry_dir, start_date, end_date, keyword="", tag="", type_filter="Any"):
+    """
+    Find entries matching the advanced search criteria.
+
+    Matches are the same as AdvancedSearchWindow.scan_metadata's: the keyword is
+    a case-insensitive substring of the title or preview, and the tag must equal
+    one of the entry's tags, ignoring case. Trigram MATCH narrows the candidates
+    and instr() applies the exact test.
+
+    Args:
+        username (str): The user whose entries are searched
+        entry_dir (str): The user's entry directory, re-checked before the query
+        start_date (str): Inclusive lower bound, "yyyy-MM-dd"
+        end_date (str): Inclusive upper bound, "yyyy-MM-dd"
+        keyword (str): Text to match in the title or preview
+        tag (str): Tag the entry must carry
+        type_filter (str): "Any", "Text only" or "With Image"
+
+    Returns:
+        list or None: (date, title, enc_path) tuples, or None if the index is unavailable
+    """
+    keyword = keyword.lower()
+    tag = tag.lower()
+    sql = "SELECT date, title, path FROM entries_fts WHERE username = ? AND date BETWEEN ? AND ?"
+    params = [username, start_date, end_date]
+
+    terms = []
+    if keyword:
+        sql += " AND (instr(title_ci, ?) > 0 OR instr(preview_ci, ?) > 0)"
+        params += [keyword, keyword]
+        if len(keyword) >= _TRIGRAM_MIN:
+            terms.append("{title_ci preview_ci} : " + _phrase(keyword))
+    if tag:
+        sql += " AND instr(tags_ci, ?) > 0"
+        params.append(TAG_SEP + tag + TAG_SEP)
+        if len(tag) >= _TRIGRAM_MIN:
+            terms.append("tags_ci : " + _phrase(tag))
+    if terms:
+        sql += " AND entries_fts MATCH ?"
+        params.append(" AND ".join(terms))
+
+    if type_filter == "Text only":
+        sql += " AND has_image = 0"
+    elif type_filter == "With Image":
+        sql += " AND has_image = 1"
+
+    conn = get_conn()
+    try:
+        with write_lock, conn:
+            _ensure_indexed(conn.cursor(), username, entry_dir)
+        return conn.execute(sql, params).fetchall()
+    except sqlite3.OperationalError:
+        return None
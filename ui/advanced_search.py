@@ -3,7 +3,16 @@ from PyQt5.QtWidgets import (
     QComboBox, QDateEdit, QListWidget, QListWidgetItem, QMessageBox
 )
 from PyQt5.QtCore import QDate
-import os, json
+import os
+from utils.entries import iter_meta_files_between, entry_date, add_search_fields, ENC_SUFFIX, META_SUFFIX
+from db.search_index import search
+from utils.jsonio import dump_file, load_files
+
+try:
+    # RE2 matches in linear time with a DFA; the stdlib engine is the fallback
+    import re2 as regex
+except ImportError:
+    import re as regex
 
 class AdvancedSearchWindow(QWidget):
     def __init__(self, username):
@@ -70,20 +79,42 @@ class AdvancedSearchWindow(QWidget):
         start_date = self.start_date.date().toString("yyyy-MM-dd")
         end_date = self.end_date.date().toString("yyyy-MM-dd")
 
-        results = []
-        for file in os.listdir(self.entry_dir):
-            if file.endswith(".meta.json"):
-                meta_path = os.path.join(self.entry_dir, file)
-                with open(meta_path, "r") as f:
-                    meta = json.load(f)
+        results = search(self.username, self.entry_dir, start_date, end_date, keyword, tag, type_filter)
+        if results is None:
+            results = self.scan_metadata(keyword, tag, type_filter, start_date, end_date)
+
+        if results:
+            for date, title, path in results:
+                item = QListWidgetItem(f"{date} - {title}")
+                item.setData(1000, path)
+                self.result_list.addItem(item)
+        else:
+            QMessageBox.information(self, "No Results", "No entries matched your search.")
 
-                date = meta.get("date", "")
+    def scan_metadata(self, keyword, tag, type_filter, start_date, end_date):
+        # Fallback used when the FTS index is unavailable
+        results = []
+        # Compile the keyword once and scan the pre-lowered title and preview in a single pass
+        keyword_pattern = regex.compile(regex.escape(keyword)) if keyword else None
+        # Only read metadata in the year/month directories that fit the date range
+        meta_paths = [entry.path for entry in iter_meta_files_between(self.entry_dir, start_date, end_date)]
+        # Read and parse the files concurrently, then filter sequentially
+        for meta_path, meta in load_files(meta_paths):
+            if meta is not None:
+                # One-time migration for metadata saved before the *_ci fields existed
+                if add_search_fields(meta):
+                    try:
+                        dump_file(meta_path, meta, indent=False)
+                    except IOError:
+                        pass
+
+                date = entry_date(meta)
                 if not (start_date <= date <= end_date):
                     continue
 
-                title = meta.get("title", "").lower()
-                content = meta.get("preview", "").lower()
-                tags = [t.lower() for t in meta.get("tags", [])]
+                title = meta["title_ci"]
+                content = meta["preview_ci"]
+                tags = meta["tags_ci"]
                 has_image = meta.get("has_image", False)
 
                 # Content type check
@@ -93,19 +124,12 @@ class AdvancedSearchWindow(QWidget):
                     continue
 
                 # Keyword check
-                if keyword and keyword not in title and keyword not in content:
+                if keyword_pattern and not keyword_pattern.search(title + "\x1f" + content):
                     continue
 
                 # Tag check
                 if tag and tag not in tags:
                     continue
 
-                results.append((date, meta.get("title", "Untitled Entry"), meta_path.replace(".meta.json", ".enc")))
-
-        if results:
-            for date, title, path in results:
-                item = QListWidgetItem(f"{date} - {title}")
-                item.setData(1000, path)
-                self.result_list.addItem(item)
-        else:
-            QMessageBox.information(self, "No Results", "No entries matched your search.")
+                results.append((date, meta.get("title", "Untitled Entry"), meta_path[:-len(META_SUFFIX)] + ENC_SUFFIX))
+        return results
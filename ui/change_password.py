@@ -1,10 +1,9 @@
-import sqlite3
-import hashlib
-import uuid
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton,
     QVBoxLayout, QMessageBox
 )
+from db.connection import get_conn, write_lock
+from utils.passwords import hash_password, verify_password, invalidate
 
 
 class ChangePasswordWindow(QWidget):
@@ -53,27 +52,28 @@ class ChangePasswordWindow(QWidget):
             return
 
         try:
-            conn = sqlite3.connect("db/users.db")
-            cursor = conn.cursor()
-            cursor.execute("SELECT password_hash, salt FROM users WHERE username = ?", (self.username,))
-            result = cursor.fetchone()
+            conn = get_conn()
+            result = conn.execute("SELECT password_hash, salt, kdf FROM users WHERE username = ? LIMIT 1",
+                                  (self.username,)).fetchone()
 
             if result:
-                stored_hash, salt = result
-                input_old_hash = hashlib.sha256((old + salt).encode()).hexdigest()
+                stored_hash, salt, kdf = result
 
-                if input_old_hash == stored_hash:
-                    new_salt = uuid.uuid4().hex
-                    new_hash = hashlib.sha256((new + new_salt).encode()).hexdigest()
-                    cursor.execute("UPDATE users SET password_hash = ?, salt = ? WHERE username = ?",
-                                   (new_hash, new_salt, self.username))
-                    conn.commit()
+                if verify_password(self.username, old, stored_hash, salt, kdf):
+                    new_hash, new_kdf = hash_password(new)
+                    # Entry keys are derived from the old hash and the salt, so both are
+                    # kept: key_hash takes the old hash the first time the password
+                    # changes, and the salt is left as it is
+                    with write_lock, conn:
+                        conn.execute("UPDATE users SET password_hash = ?, kdf = ?, "
+                                     "key_hash = COALESCE(key_hash, password_hash) WHERE username = ?",
+                                     (new_hash, new_kdf, self.username))
+                    invalidate(self.username)
                     QMessageBox.information(self, "Success", "Password updated successfully.")
                     self.close()
                 else:
                     QMessageBox.warning(self, "Error", "Incorrect current password.")
             else:
                 QMessageBox.critical(self, "Error", "User not found.")
-            conn.close()
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
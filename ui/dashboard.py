@@ -7,15 +7,379 @@ and navigating between different parts of the application.
 """
 
 import os
-import json
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
 from PyQt5.QtWidgets import (
-    QWidget, QLabel, QPushButton, QVBoxLayout, QListWidget,
+    QWidget, QLabel, QPushButton, QVBoxLayout, QListView,
     QMessageBox, QHBoxLayout, QLineEdit, QDesktopWidget,
     QCheckBox, QSpacerItem, QSizePolicy, QFrame, QGraphicsDropShadowEffect
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import (
+    Qt, QTimer, QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
+)
 from PyQt5.QtGui import QColor
-from ui.editor import EditorWindow
+from utils.entries import scan_entries, ENC_SUFFIX, META_SUFFIX
+from utils.meta_cache import shared_cache
+from db.search_index import remove_entry
+from ui.stats import StatsWindow
+from ui.entry_calendar import EntryCalendarWindow
+from ui.mood_tracker import MoodTrackerWindow
+from ui.change_password import ChangePasswordWindow
+
+try:
+    # Deleted entries go to the system trash when send2trash is installed
+    from send2trash import send2trash as discard_file
+except ImportError:
+    discard_file = os.remove
+
+
+# Colour schemes for the dashboard themes
+DASHBOARD_PALETTES = {
+    "dark": {
+        "bg_grad": "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #1a1a2e, stop:0.5 #16213e, stop:1 #0f3460)",
+        "card_grad": "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #23243a, stop:1 #2d3250)",
+        "title_color": "#90caf9",
+        "label_color": "#e6e6e6",
+        "input_bg": "#23243a",
+        "input_border": "#42a5f5",
+        "input_text": "#e6e6e6",
+        "list_bg": "#23243a",
+        "list_border": "#42a5f5",
+    },
+    "light": {
+        "bg_grad": "#e3f2fd",
+        "card_grad": "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #e3f2fd, stop:0.5 #90caf9, stop:1 #42a5f5)",
+        "title_color": "#1976d2",
+        "label_color": "#333",
+        "input_bg": "#f5fafd",
+        "input_border": "#1976d2",
+        "input_text": "#222",
+        "list_bg": "#f5fafd",
+        "list_border": "#90caf9",
+    },
+}
+
+# Card drop-shadow colour per theme, shared by every dashboard window
+CARD_SHADOW_COLORS = {
+    "dark": QColor(0, 0, 0, 120),
+    "light": QColor(66, 165, 245, 80),  # Semi-transparent blue shadow
+}
+
+# Stylesheet for the whole dashboard, filled from a palette plus title_margin.
+# It is set once on the window; object names select the individual widgets.
+DASHBOARD_QSS = """
+    QWidget {{
+        background: {bg_grad};
+    }}
+    QLabel#dashboardTitle {{
+        font-size: 36px;
+        font-weight: bold;
+        color: {title_color};
+        margin-bottom: {title_margin}px;
+        background: transparent;
+    }}
+    QCheckBox#themeToggle {{
+        font-size: 16px;
+        color: {label_color};
+        background: transparent;
+    }}
+    QLineEdit#searchBar {{
+        padding: 12px;
+        border: 2px solid {input_border};
+        border-radius: 10px;
+        font-size: 16px;
+        background: {input_bg};
+        color: {input_text};
+    }}
+    QListView#entryList {{
+        background: {list_bg};
+        border: 2px solid {list_border};
+        border-radius: 12px;
+        font-size: 15px;
+        padding: 8px;
+        color: {input_text};
+    }}
+    QFrame#dashboardCard {{
+        background: {card_grad};
+        border-radius: 22px;
+        padding: 36px 36px 28px 36px;
+        margin: auto;
+    }}
+    QPushButton#dashboardBtn {{
+        font-size: 15px;
+        font-weight: bold;
+        padding: 8px 6px;
+        border-radius: 14px;
+        background-color: #1976d2;
+        color: #fff;
+        border: none;
+        text-align: center;
+    }}
+    QPushButton#dashboardBtn:hover {{
+        background-color: #1565c0;
+    }}
+"""
+
+@lru_cache(maxsize=None)
+def dashboard_styles(theme, scale_step):
+    """
+    Build the dashboard stylesheet for a theme and scale step.
+
+    Results are memoised for the life of the process, so every dashboard
+    window shares the same strings and each pair is only formatted once.
+
+    Args:
+        theme (str): "light" or "dark"
+        scale_step (int): The responsive scale factor times ten
+
+    Returns:
+        str: The stylesheet for the dashboard window
+    """
+    values = dict(DASHBOARD_PALETTES[theme], title_margin=int(8 * scale_step / 10))
+    return DASHBOARD_QSS.format_map(values)
+
+
+def scan_entry_labels(entry_dir, meta_cache):
+    """
+    Build the dashboard label for every entry in a user's directory.
+
+    Args:
+        entry_dir (str): The user's entry directory
+        meta_cache (MetaCache): Cache used to avoid re-parsing unchanged metadata
+
+    Returns:
+        list: (label, path, label_lower) tuples, where path is the entry's
+              .enc file and label_lower is the label lower-cased for searching
+    """
+    entries = []
+    # Recursively scan for encrypted entry files paired with their metadata
+    pairs = scan_entries(entry_dir)
+    meta_entries = [meta_entry for _, meta_entry in pairs if meta_entry is not None]
+    # Load metadata (from cache if unchanged, otherwise parsed concurrently)
+    metas = iter(meta_cache.load_all(meta_entries))
+    for enc, meta_entry in pairs:
+        file = enc.name
+        if meta_entry is not None:
+            meta = next(metas)
+            if meta is not None:
+                # Create formatted label from the metadata
+                label = f"{meta.get('title')} | {meta.get('start_time')} → {meta.get('end_time', '---')}"
+                tags = meta.get("tags", [])
+                if tags:
+                    label += f"\nTags: {', '.join(tags)}"
+            else:
+                # Use filename as fallback if metadata is corrupted
+                label = file
+        else:
+            # Use filename as fallback if no metadata exists
+            label = file
+        entries.append((label, enc.path, label.lower()))
+    meta_cache.prune({meta_entry.path for meta_entry in meta_entries})
+    return entries
+
+
+def build_trigram_index(entries):
+    """
+    Index every three-character substring of the entries' search text.
+
+    Any label containing a query must contain each of the query's trigrams,
+    so intersecting their postings gives a small superset of the matches.
+
+    Args:
+        entries (list): (label, path, label_lower) tuples
+
+    Returns:
+        dict: Trigram -> set of positions in entries whose label_lower contains it
+    """
+    index = defaultdict(set)
+    for position, (_, _, lower) in enumerate(entries):
+        for i in range(len(lower) - 2):
+            index[lower[i:i + 3]].add(position)
+    return index
+
+
+class _EntryScanSignals(QObject):
+    """Signals emitted by _EntryScanner; QRunnable itself cannot carry signals."""
+    finished = pyqtSignal(int, list, object)
+
+
+class _EntryScanner(QRunnable):
+    """
+    Scans a user's entries on a QThreadPool worker so the dashboard stays responsive.
+    """
+
+    def __init__(self, entry_dir, meta_cache, generation):
+        super().__init__()
+        self.entry_dir = entry_dir
+        self.meta_cache = meta_cache
+        self.generation = generation
+        self.signals = _EntryScanSignals()
+
+    def run(self):
+        # An exception escaping a QRunnable aborts the process, so a failed
+        # scan shows an empty list instead
+        try:
+            entries = scan_entry_labels(self.entry_dir, self.meta_cache)
+        except Exception:
+            entries = []
+        self.signals.finished.emit(self.generation, entries, build_trigram_index(entries))
+
+
+class _EntryDeleteSignals(QObject):
+    """Signals emitted by _EntryDeleter."""
+    deleted = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class _EntryDeleter(QRunnable):
+    """
+    Deletes an entry file and its metadata on a QThreadPool worker.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = _EntryDeleteSignals()
+
+    def run(self):
+        try:
+            discard_file(self.path)
+        except OSError:
+            self.signals.failed.emit(self.path)
+            return
+        # Also delete the metadata file; the entry is gone even if this fails
+        try:
+            discard_file(self.path[:-len(ENC_SUFFIX)] + META_SUFFIX)
+        except OSError:
+            pass
+        remove_entry(self.path)
+        self.signals.deleted.emit(self.path)
+
+
+class EntryListModel(QAbstractListModel):
+    """
+    List model over the dashboard's entries, exposing those that match the search.
+
+    The model keeps the (label, path, label_lower) tuples and the positions of
+    the ones currently shown, so filtering never builds per-row items. While
+    the user types, each query usually extends an earlier one, so only the
+    entries that matched the longest earlier prefix need to be checked again;
+    results are kept only for the prefixes of the current query.
+    Queries of three or more characters are also narrowed with a trigram
+    index, whichever leaves fewer entries to check.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._results = {"": []}  # query -> matching entry positions
+        self._query = ""
+        self._rows = []  # entry position of each visible row
+        self._trigrams = None  # see build_trigram_index; built on demand if missing
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        label, path, _ = self._entries[self._rows[index.row()]]
+        if role == Qt.DisplayRole:
+            return label
+        if role == Qt.UserRole:
+            return path
+        return None
+
+    def set_entries(self, entries, trigrams=None):
+        """
+        Show a new set of entries, keeping the current search.
+
+        Args:
+            entries (list): (label, path, label_lower) tuples
+            trigrams (dict): The entries' build_trigram_index, if already built
+        """
+        self.beginResetModel()
+        self._entries = entries
+        self._trigrams = trigrams
+        self._results = {"": list(range(len(entries)))}
+        self._rows = self._match(self._query)
+        self.endResetModel()
+
+    def set_query(self, text):
+        """
+        Show only the entries whose label contains text.
+
+        Args:
+            text (str): The search text; empty shows every entry
+        """
+        self.beginResetModel()
+        self._query = text.lower()
+        self._rows = self._match(self._query)
+        self.endResetModel()
+
+    def entry_position(self, row):
+        """
+        Get the position in the entry list of a visible row.
+
+        Args:
+            row (int): The visible row
+
+        Returns:
+            int: The index into the list passed to set_entries
+        """
+        return self._rows[row]
+
+    def remove_entry(self, position):
+        """
+        Remove one entry from the list passed to set_entries.
+
+        Args:
+            position (int): The entry's index in that list
+        """
+        row = bisect_left(self._rows, position)
+        shown = row < len(self._rows) and self._rows[row] == position
+        if shown:
+            self.beginRemoveRows(QModelIndex(), row, row)
+        del self._entries[position]
+        # Later entries moved up, so cached results are stale
+        self._rows = [p - (p > position) for p in self._rows if p != position]
+        self._results = {"": list(range(len(self._entries))), self._query: self._rows}
+        self._trigrams = None
+        if shown:
+            self.endRemoveRows()
+
+    def _match(self, query):
+        rows = self._results.get(query)
+        if rows is None:
+            # Narrow the result of the longest query already answered
+            prefix = query[:-1]
+            while prefix not in self._results:
+                prefix = prefix[:-1]
+            candidates = self._results[prefix]
+            if len(query) >= 3:
+                indexed = self._trigram_candidates(query)
+                if len(indexed) < len(candidates):
+                    candidates = sorted(indexed)
+            entries = self._entries
+            rows = [p for p in candidates if query in entries[p][2]]
+            self._results[query] = rows
+        # Only prefixes of the current query can narrow the next one; results
+        # for abandoned queries would otherwise pile up for the whole session
+        self._results = {q: r for q, r in self._results.items() if query.startswith(q)}
+        return rows
+
+    def _trigram_candidates(self, query):
+        if self._trigrams is None:
+            self._trigrams = build_trigram_index(self._entries)
+        postings = []
+        for i in range(len(query) - 2):
+            posting = self._trigrams.get(query[i:i + 3])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
 
 
 class DashboardWindow(QWidget):
@@ -39,10 +403,13 @@ class DashboardWindow(QWidget):
         theme (str): Current UI theme ("light" or "dark")
         title (QLabel): Welcome message display
         card_frame (QFrame): Main content container with styling
+        card_shadow (QGraphicsDropShadowEffect): The card's drop shadow
         theme_toggle (QCheckBox): Dark mode toggle switch
         search_bar (QLineEdit): Entry search input field
-        entry_list (QListWidget): List of user's journal entries
-        all_entries (list): Complete list of entries for filtering
+        entry_list (QListView): List of user's journal entries
+        entry_model (EntryListModel): The entries shown in entry_list, filtered by the search
+        all_entries (list): (label, path, label_lower) for every entry, used for filtering and lookup
+        meta_cache (MetaCache): Parsed metadata reused across loads, windows and sessions
     """
     
     def __init__(self, username):
@@ -55,9 +422,12 @@ class DashboardWindow(QWidget):
         super().__init__()
         self.username = username
         self.theme = "light"  # Default theme setting
+        self.meta_cache = shared_cache(self.get_entry_dir())
+        self.all_entries = []  # Filled in when the background scan finishes
+        self._scan_generation = 0
         self.setWindowTitle(f"QuietQuill - Dashboard ({self.username})")
         self.setMinimumSize(900, 600)
-        self.setStyleSheet("background-color: #e3f2fd;")
+        self._applied_style_key = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -89,22 +459,13 @@ class DashboardWindow(QWidget):
         # Card frame with gradient background and drop shadow for modern look
         self.card_frame = QFrame()
         self.card_frame.setObjectName("dashboardCard")
-        # CSS-like styling for gradient background from white to light blue
-        self.card_frame.setStyleSheet("""
-            QFrame#dashboardCard {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #ffffff, stop:1 #e3f2fd);
-                border-radius: 22px;
-                padding: 36px 36px 28px 36px;
-                margin: auto;
-            }
-        """)
-        # Drop shadow effect for depth and modern appearance
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(24)
-        shadow.setColor(QColor(66, 165, 245, 80))  # Semi-transparent blue shadow
-        shadow.setOffset(0, 10)  # Slight vertical offset for depth
-        self.card_frame.setGraphicsEffect(shadow)
+        # Drop shadow effect for depth and modern appearance; it is kept and
+        # recoloured on theme changes rather than rebuilt
+        self.card_shadow = QGraphicsDropShadowEffect()
+        self.card_shadow.setBlurRadius(24)
+        self.card_shadow.setColor(CARD_SHADOW_COLORS[self.theme])
+        self.card_shadow.setOffset(0, 10)  # Slight vertical offset for depth
+        self.card_frame.setGraphicsEffect(self.card_shadow)
 
         # Card layout for organizing dashboard components
         self.card_layout = QVBoxLayout(self.card_frame)
@@ -123,11 +484,19 @@ class DashboardWindow(QWidget):
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("🔍 Search by tag, title or date...")
         self.search_bar.setObjectName("searchBar")
-        self.search_bar.textChanged.connect(self.filter_entries)
+        # Debounce filtering so a burst of keystrokes triggers a single pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(lambda: self.filter_entries(self.search_bar.text()))
+        self.search_bar.textChanged.connect(lambda _: self._search_timer.start(150))
         self.card_layout.addWidget(self.search_bar)
 
-        # Entry list for displaying journal entries
-        self.entry_list = QListWidget()
+        # Entry list for displaying journal entries; the view only renders
+        # visible rows and filtering happens in the model
+        self.entry_model = EntryListModel(self)
+        self.entry_list = QListView()
+        self.entry_list.setModel(self.entry_model)
+        self.entry_list.setEditTriggers(QListView.NoEditTriggers)
         self.entry_list.setObjectName("entryList")
         self.card_layout.addWidget(self.entry_list)
 
@@ -155,7 +524,8 @@ class DashboardWindow(QWidget):
         change_pw_btn.clicked.connect(self.change_password)
         logout_btn.clicked.connect(self.logout)
 
-        # Apply consistent styling to all action buttons
+        # Apply consistent sizing to all action buttons; the window
+        # stylesheet styles them through their shared object name
         for btn in [mood_btn, calendar_btn, stats_btn, open_btn, new_btn, delete_btn, change_pw_btn, logout_btn]:
             btn.setObjectName("dashboardBtn")
             btn.setMinimumHeight(64)
@@ -163,21 +533,6 @@ class DashboardWindow(QWidget):
             btn.setMinimumWidth(90)
             btn.setMaximumWidth(110)
             btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-            btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 15px;
-                    font-weight: bold;
-                    padding: 8px 6px;
-                    border-radius: 14px;
-                    background-color: #1976d2;
-                    color: #fff;
-                    border: none;
-                    text-align: center;
-                }
-                QPushButton:hover {
-                    background-color: #1565c0;
-                }
-            """)
             button_row.addWidget(btn)
 
         self.card_layout.addLayout(button_row)
@@ -186,7 +541,9 @@ class DashboardWindow(QWidget):
         self.main_layout.addWidget(self.card_frame, alignment=Qt.AlignHCenter)
         self.main_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         self.setLayout(self.main_layout)
-        self.apply_dynamic_styles()
+        self._restyle_timer = QTimer(self)
+        self._restyle_timer.setSingleShot(True)
+        self._restyle_timer.timeout.connect(self.apply_dynamic_styles)
         self.load_entries()
 
     def resizeEvent(self, event):
@@ -196,10 +553,31 @@ class DashboardWindow(QWidget):
         Args:
             event: The resize event containing new window dimensions
         """
-        # Reapply styles when window is resized for responsive design
-        self.apply_dynamic_styles()
+        self.card_frame.setMaximumWidth(int(self.width() * 0.98))
+        # Coalesce a drag-resize into one restyle once the size settles
+        self._restyle_timer.start(50)
         return super().resizeEvent(event)
 
+    def showEvent(self, event):
+        """
+        Apply any styling deferred while the window was hidden.
+
+        Args:
+            event: The show event
+        """
+        self.apply_dynamic_styles()
+        return super().showEvent(event)
+
+    def closeEvent(self, event):
+        """
+        Persist the metadata cache when the dashboard closes.
+
+        Args:
+            event: The close event
+        """
+        self.meta_cache.save()
+        return super().closeEvent(event)
+
     def toggle_theme(self):
         """
         Toggle between light and dark themes.
@@ -219,82 +597,31 @@ class DashboardWindow(QWidget):
         Apply responsive styling based on current theme and window dimensions.
         
         This method calculates appropriate styling for the current theme
-        (light or dark) and applies it to all UI components. It handles
-        color schemes, gradients, and responsive scaling.
+        (light or dark) and applies it to all UI components. The stylesheet is
+        cached per theme and scale step and only reapplied when that pair
+        changes, since every setStyleSheet call makes Qt re-parse it and
+        re-polish the widget tree. A hidden dashboard is restyled when it is
+        next shown instead.
         """
+        if not self.isVisible():
+            return
+
         # Calculate scaling factors for responsive design
         w = max(self.width(), 900)
         h = max(self.height(), 600)
         scale = min(w / 1200, h / 800)
         scale = max(0.7, min(scale, 1.5))
 
-        # Define color schemes for different themes
-        if self.theme == "dark":
-            # Dark theme color palette
-            bg_grad = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #1a1a2e, stop:0.5 #16213e, stop:1 #0f3460)"
-            card_grad = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #23243a, stop:1 #2d3250)"
-            title_color = "#90caf9"
-            label_color = "#e6e6e6"
-            input_bg = "#23243a"
-            input_border = "#42a5f5"
-            input_text = "#e6e6e6"
-            list_bg = "#23243a"
-            list_border = "#42a5f5"
-        else:
-            # Light theme color palette
-            bg_grad = "#e3f2fd"
-            card_grad = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #e3f2fd, stop:0.5 #90caf9, stop:1 #42a5f5)"
-            title_color = "#1976d2"
-            label_color = "#333"
-            input_bg = "#f5fafd"
-            input_border = "#1976d2"
-            input_text = "#222"
-            list_bg = "#f5fafd"
-            list_border = "#90caf9"
-
-        # Apply theme-specific styling to all components
-        self.setStyleSheet(f"background: {bg_grad};")
         self.card_frame.setMaximumWidth(int(self.width() * 0.98))
-        self.title.setStyleSheet(f"""
-            font-size: 36px;
-            font-weight: bold;
-            color: {title_color};
-            margin-bottom: {int(8 * scale)}px;
-            background: transparent;
-        """)
-        self.theme_toggle.setStyleSheet(f"""
-            QCheckBox {{
-                font-size: 16px;
-                color: {label_color};
-                background: transparent;
-            }}
-        """)
-        self.search_bar.setStyleSheet(f"""
-            padding: 12px;
-            border: 2px solid {input_border};
-            border-radius: 10px;
-            font-size: 16px;
-            background: {input_bg};
-            color: {input_text};
-        """)
-        self.entry_list.setStyleSheet(f"""
-            QListWidget {{
-                background: {list_bg};
-                border: 2px solid {list_border};
-                border-radius: 12px;
-                font-size: 15px;
-                padding: 8px;
-                color: {input_text};
-            }}
-        """)
-        self.card_frame.setStyleSheet(f"""
-            QFrame#dashboardCard {{
-                background: {card_grad};
-                border-radius: 22px;
-                padding: 36px 36px 28px 36px;
-                margin: auto;
-            }}
-        """)
+
+        key = (self.theme, round(scale * 10))
+        if key == self._applied_style_key:
+            return
+        # One window-level stylesheet styles every component by object name,
+        # so Qt re-polishes the tree once per change
+        self.setStyleSheet(dashboard_styles(*key))
+        self.card_shadow.setColor(CARD_SHADOW_COLORS[self.theme])
+        self._applied_style_key = key
 
     def open_stats(self):
         """
@@ -303,7 +630,6 @@ class DashboardWindow(QWidget):
         Creates and displays a new StatsWindow instance showing
         various statistics about the user's journal entries.
         """
-        from ui.stats import StatsWindow
         self.stats_window = StatsWindow(self.username)
         self.stats_window.show()
 
@@ -323,7 +649,6 @@ class DashboardWindow(QWidget):
         Creates and displays a new EntryCalendarWindow instance
         allowing the user to view entries by date on a calendar.
         """
-        from ui.entry_calendar import EntryCalendarWindow
         self.calendar_window = EntryCalendarWindow(self.username)
         self.calendar_window.show()
 
@@ -334,7 +659,6 @@ class DashboardWindow(QWidget):
         Creates and displays a new MoodTrackerWindow instance
         allowing the user to track their mood over time.
         """
-        from ui.mood_tracker import MoodTrackerWindow
         self.mood_window = MoodTrackerWindow(self.username)
         self.mood_window.show()
 
@@ -342,73 +666,42 @@ class DashboardWindow(QWidget):
         """
         Load all journal entries for the current user.
         
-        This method scans the user's entry directory recursively,
-        loads metadata for each entry, and populates the entry list
-        with formatted information including titles, timestamps, and tags.
-        """
-        self.entry_list.clear()
-        self.all_entries = []  # Store all entries for filtering
-
-        entry_path = self.get_entry_dir()
-        # Recursively scan for encrypted entry files
-        for root, _, files in os.walk(entry_path):
-            for file in files:
-                if file.endswith(".enc"):
-                    # Look for corresponding metadata file
-                    meta_file = file.replace(".enc", ".meta.json")
-                    meta_path = os.path.join(root, meta_file)
-                    if os.path.exists(meta_path):
-                        try:
-                            # Load metadata and create formatted label
-                            with open(meta_path, "r") as f:
-                                meta = json.load(f)
-                                label = f"{meta.get('title')} | {meta.get('start_time')} → {meta.get('end_time', '---')}"
-                                tags = meta.get("tags", [])
-                                if tags:
-                                    label += f"\nTags: {', '.join(tags)}"
-                                self.all_entries.append((label, file))
-                        except (json.JSONDecodeError, IOError):
-                            # Use filename as fallback if metadata is corrupted
-                            self.all_entries.append((file, file))
-                    else:
-                        # Use filename as fallback if no metadata exists
-                        self.all_entries.append((file, file))
-        self.refresh_entry_list()
-
-    def new_entry(self):
-        """
-        Create a new journal entry.
-        
-        Opens a new EditorWindow instance for creating a new
-        journal entry with the current theme settings.
+        Starts a background scan of the user's entry directory. When it
+        finishes, _on_entries_ready populates the entry list with formatted
+        information including titles, timestamps, and tags.
         """
-        self.editor = EditorWindow(self.username)
-        self.editor.show()
+        self._scan_generation += 1
+        scanner = _EntryScanner(self.get_entry_dir(), self.meta_cache, self._scan_generation)
+        scanner.signals.finished.connect(self._on_entries_ready)
+        QThreadPool.globalInstance().start(scanner)
 
-    def open_entry(self):
+    def _on_entries_ready(self, generation, entries, trigrams):
         """
-        Open the selected entry in the editor window.
-        
-        Gets the currently selected entry from the list and opens
-        it in a new EditorWindow instance for viewing and editing.
-        """
-        selected = self.entry_list.currentItem()
-        if selected:
-            filename = selected.data(Qt.UserRole)
-            self.editor = EditorWindow(self.username, filename=filename, theme=self.theme)
-            self.editor.show()
+        Receive the result of a background entry scan.
 
+        Args:
+            generation (int): The scan's sequence number
+            entries (list): (label, path, label_lower) tuples for every entry
+            trigrams (dict): The entries' search index from build_trigram_index
+        """
+        # A newer scan has been started since this one; its result will follow
+        if generation != self._scan_generation:
+            return
+        self.all_entries = entries
+        self.refresh_entry_list(trigrams)
 
-    def refresh_entry_list(self):
+    def refresh_entry_list(self, trigrams=None):
         """
         Refresh the entry list display with current entries.
         
-        Updates the QListWidget to show all entries from the
-        all_entries list, used after filtering or loading.
+        Points the entry model at the all_entries list after loading, in a
+        single model reset. The active search filter is kept and applied to
+        the new entries.
+
+        Args:
+            trigrams (dict): The entries' search index, if already built
         """
-        self.entry_list.clear()
-        for label, _ in self.all_entries:
-            self.entry_list.addItem(label)
+        self.entry_model.set_entries(self.all_entries, trigrams)
 
     def filter_entries(self, text):
         """
@@ -420,29 +713,20 @@ class DashboardWindow(QWidget):
         Args:
             text (str): The search text to filter by
         """
-        text = text.lower()
-        # Filter entries based on case-insensitive text matching
-        filtered = [(label, fname) for label, fname in self.all_entries if text in label.lower()]
-        self.entry_list.clear()
-        for label, _ in filtered:
-            self.entry_list.addItem(label)
+        # Case-insensitive substring match, evaluated by the entry model
+        self.entry_model.set_query(text)
 
-    def find_file_path(self, filename):
+    def selected_entry_index(self):
         """
-        Find the full path of an entry file by searching the user's directory.
-        
-        Args:
-            filename (str): The filename to search for
-            
+        Get the position in all_entries of the selected list row.
+
         Returns:
-            str or None: The full path to the file, or None if not found
+            int: The index into all_entries, or -1 if nothing is selected
         """
-        entry_dir = self.get_entry_dir()
-        # Search recursively through user's entry directory
-        for root, _, files in os.walk(entry_dir):
-            if filename in files:
-                return os.path.join(root, filename)
-        return None
+        index = self.entry_list.currentIndex()
+        if not index.isValid():
+            return -1
+        return self.entry_model.entry_position(index.row())
 
     def open_entry(self):
         """
@@ -451,11 +735,12 @@ class DashboardWindow(QWidget):
         Gets the currently selected entry from the list and opens
         it in a new EditorWindow instance for viewing and editing.
         """
-        index = self.entry_list.currentRow()
+        index = self.selected_entry_index()
         if index >= 0:
-            # Get the filename from the selected entry
-            _, file = self.all_entries[index]
-            self.editor = EditorWindow(self.username, file)
+            # Get the entry path recorded when the list was loaded
+            path = self.all_entries[index][1]
+            from ui.editor import EditorWindow
+            self.editor = EditorWindow(self.username, filename=path, theme=self.theme)
             self.editor.show()
         else:
             QMessageBox.warning(self, "No Selection", "Please select an entry.")
@@ -467,7 +752,8 @@ class DashboardWindow(QWidget):
         Opens a new EditorWindow instance for creating a new
         journal entry with the current theme settings.
         """
-        self.editor = EditorWindow(self.username)
+        from ui.editor import EditorWindow
+        self.editor = EditorWindow(self.username, theme=self.theme)
         self.editor.show()
 
     def delete_entry(self):
@@ -475,30 +761,37 @@ class DashboardWindow(QWidget):
         Delete the selected journal entry.
         
         Prompts the user for confirmation, then deletes both the
-        encrypted entry file and its associated metadata file.
-        Refreshes the entry list after deletion.
+        encrypted entry file and its associated metadata file on a
+        background worker. The entry's row is removed once that finishes.
         """
-        index = self.entry_list.currentRow()
+        index = self.selected_entry_index()
         if index >= 0:
-            label, file = self.all_entries[index]
+            label, path, _ = self.all_entries[index]
             # Confirm deletion with user
             confirm = QMessageBox.question(self, "Confirm Delete", f"Delete entry:\n\n{label}?", QMessageBox.Yes | QMessageBox.No)
             if confirm == QMessageBox.Yes:
-                # Find and delete the entry file
-                path = self.find_file_path(file)
-                if path:
-                    os.remove(path)
-                    # Also delete the metadata file if it exists
-                    meta_path = path.replace(".enc", ".meta.json")
-                    if os.path.exists(meta_path):
-                        os.remove(meta_path)
-                    # Refresh the entry list
-                    self.load_entries()
-                else:
-                    QMessageBox.warning(self, "Error", "Could not find the selected entry.")
+                # Delete the entry at the path recorded when the list was loaded
+                deleter = _EntryDeleter(path)
+                deleter.signals.deleted.connect(self._on_entry_deleted)
+                deleter.signals.failed.connect(
+                    lambda _: QMessageBox.warning(self, "Error", "Could not delete the selected entry."))
+                QThreadPool.globalInstance().start(deleter)
         else:
             QMessageBox.warning(self, "No Selection", "Select an entry to delete.")
 
+    def _on_entry_deleted(self, path):
+        """
+        Remove a deleted entry's row without rescanning the directory.
+
+        Args:
+            path (str): The deleted entry's .enc file
+        """
+        for position, (_, entry_path, _) in enumerate(self.all_entries):
+            if entry_path == path:
+                # The model shares all_entries and removes the entry from it
+                self.entry_model.remove_entry(position)
+                break
+
     def change_password(self):
         """
         Open the password change window.
@@ -506,7 +799,6 @@ class DashboardWindow(QWidget):
         Creates and displays a new ChangePasswordWindow instance
         for the current user to change their account password.
         """
-        from ui.change_password import ChangePasswordWindow
         self.change_window = ChangePasswordWindow(self.username)
         self.change_window.show()
 
@@ -517,6 +809,7 @@ class DashboardWindow(QWidget):
         Creates a new LoginWindow instance, displays it, and closes
         the current dashboard window to complete the logout process.
         """
+        # Deferred: ui.login_window imports this module at its top
         from ui.login_window import LoginWindow
         self.login_window = LoginWindow()
         self.login_window.show()
@@ -6,18 +6,397 @@ in the QuietQuill application. It supports features like image insertion, emoji
 insertion, tagging, categorization, encryption, and basic sentiment analysis.
 """
 
-import os
 import json
+import os
+import re
 import datetime
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QTextEdit, QPushButton,
     QFileDialog, QMessageBox, QLabel, QHBoxLayout, QInputDialog,
-    QComboBox, QLineEdit, QListWidget, QListWidgetItem, QDesktopWidget,
-    QSpacerItem, QSizePolicy, QFrame, QGraphicsDropShadowEffect
+    QComboBox, QLineEdit, QListView, QPlainTextEdit, QDesktopWidget,
+    QSpacerItem, QSizePolicy, QFrame, QGraphicsDropShadowEffect, QGraphicsPixmapItem,
+    QGraphicsScene, qDrawBorderPixmap
+)
+from PyQt5.QtGui import (
+    QTextCharFormat, QTextCursor, QTextDocument, QTextFormat, QTextImageFormat, QFont, QColor,
+    QImageReader, QPainter, QPixmap
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QMargins, QRectF, QSize, QStringListModel,
+    pyqtSignal
 )
-from PyQt5.QtGui import QTextImageFormat, QFont, QColor
-from PyQt5.QtCore import Qt
 from utils.encryption import encrypt_data, decrypt_data
+from utils.entries import (
+    add_search_fields, iter_entry_files, locate_entry_file, ENC_SUFFIX, META_SUFFIX
+)
+from utils.jsonio import dump_file, load_file
+from utils.meta_cache import shared_cache
+from db.search_index import index_entry, tag_counts
+
+# Word lists for the simple sentiment analysis
+HAPPY_WORDS = frozenset({"happy", "joy", "excited", "love", "grateful", "awesome", "smile"})
+SAD_WORDS = frozenset({"sad", "tired", "angry", "depressed", "cry", "lonely", "hate"})
+# Every mood word in one case-insensitive pattern, and the score each one adds
+_MOOD_SIGN = {**{word: 1 for word in HAPPY_WORDS}, **{word: -1 for word in SAD_WORDS}}
+_MOOD_RE = re.compile(r"\b(" + "|".join(sorted(_MOOD_SIGN)) + r")\b", re.IGNORECASE)
+
+
+def block_stats(text):
+    """
+    Count the words in a block of text and score its mood.
+
+    Args:
+        text (str): The text of one paragraph
+
+    Returns:
+        tuple: (word count, sentiment score), where each happy word adds one
+               and each sad word subtracts one
+    """
+    score = sum(_MOOD_SIGN[match.group(1).lower()] for match in _MOOD_RE.finditer(text))
+    return len(text.split()), score
+
+
+EDITOR_QSS = """
+    QWidget {{
+        background: {window_bg};
+    }}
+    QLabel#editorTitle {{
+        font-size: 36px;
+        font-weight: bold;
+        color: {title_color};
+        margin-bottom: {title_margin}px;
+        background: transparent;
+    }}
+    QLabel#entryTitle {{
+        font-size: 22px;
+        font-weight: bold;
+        color: {title_color};
+        background: transparent;
+    }}
+    #diaryTextEdit {{
+        background: {input_bg};
+        color: {input_text};
+        border: 2px solid {input_border};
+        border-radius: 14px;
+        font-family: 'Georgia', 'Times New Roman', serif;
+        font-size: 17px;
+        padding: 14px;
+    }}
+    QLabel#infoLabel {{
+        font-size: 14px;
+        color: {label_color};
+        background: transparent;
+    }}
+    QComboBox#categoryCombo {{
+        background: {input_bg};
+        color: {input_text};
+        border: 2px solid {input_border};
+        border-radius: 8px;
+        font-size: 15px;
+        padding: 6px;
+    }}
+    QLineEdit#tagsInput {{
+        background: {input_bg};
+        color: {input_text};
+        border: 2px solid {input_border};
+        border-radius: 8px;
+        font-size: 15px;
+        padding: 6px;
+    }}
+    QListView#suggestionList {{
+        background: {list_bg};
+        border: 2px solid {list_border};
+        border-radius: 8px;
+        font-size: 14px;
+        color: {input_text};
+        padding: 4px;
+    }}
+    QFrame#editorCard {{
+        background: {card_grad};
+        border-radius: 22px;
+        padding: 36px 36px 28px 36px;
+        margin: auto;
+    }}
+    QPushButton#editorBtn {{
+        font-size: 15px;
+        font-weight: bold;
+        padding: 8px 6px;
+        border-radius: 14px;
+        background-color: #ffd54f;
+        color: #795548;
+        border: none;
+        text-align: center;
+    }}
+    QPushButton#editorBtn:hover {{
+        background-color: #ffe082;
+    }}
+"""
+
+
+@lru_cache(maxsize=None)
+def editor_styles(scale_step):
+    """
+    Build the editor stylesheet for a scale step.
+
+    Results are memoised for the life of the process, so resizing back and
+    forth or opening more editors never formats the same stylesheet twice.
+
+    Args:
+        scale_step (int): The responsive scale factor times ten
+
+    Returns:
+        str: One stylesheet for the whole window, addressed by object name
+    """
+    scale = scale_step / 10
+
+    # Define color scheme for consistent theming
+    values = {
+        "window_bg": "#fffde7",
+        "card_grad": "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #fffbe7, stop:1 #ffe082)",
+        "title_color": "#b28704",
+        "label_color": "#795548",
+        "input_bg": "#fffde7",
+        "input_border": "#ffd54f",
+        "input_text": "#795548",
+        "list_bg": "#fffde7",
+        "list_border": "#ffd54f",
+        "title_margin": int(8 * scale),
+    }
+    return EDITOR_QSS.format_map(values)
+
+
+# Supported image formats for insertion
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+# Largest size an image is shown at (insert_image allows up to 800x800), so
+# larger files are decoded straight to this size instead of full resolution
+IMAGE_DISPLAY_LIMIT = QSize(800, 800)
+
+# Most tag suggestions shown at once
+TAG_SUGGESTION_LIMIT = 20
+
+# Drop shadow under the editor card
+CARD_RADIUS = 22
+CARD_PADDING = QMargins(36, 36, 36, 28)  # Matches the editorCard stylesheet padding
+CARD_SHADOW_BLUR = 24
+CARD_SHADOW_OFFSET = 10
+CARD_SHADOW_COLOR = QColor(255, 215, 64, 80)  # Semi-transparent golden shadow
+
+
+@lru_cache(maxsize=None)
+def card_shadow_pixmap():
+    """
+    Render the editor card's drop shadow once as a nine-slice pixmap.
+
+    A QGraphicsDropShadowEffect on the card itself would re-render and blur the
+    whole card, text editor included, on every repaint. Here the same effect
+    is applied once to a plain rounded square, and the result is stretched to
+    the card's size when painted.
+
+    Returns:
+        QPixmap: The shadow of a rounded square inset by CARD_SHADOW_BLUR,
+                 with the square itself left transparent
+    """
+    corner = CARD_RADIUS + CARD_SHADOW_BLUR
+    width = 2 * corner + 1
+    height = width + CARD_SHADOW_OFFSET
+    inner = QRectF(CARD_SHADOW_BLUR, CARD_SHADOW_BLUR,
+                   width - 2 * CARD_SHADOW_BLUR, width - 2 * CARD_SHADOW_BLUR)
+    shape = QPixmap(width, height)
+    shape.fill(Qt.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(CARD_SHADOW_COLOR.rgb()))  # Opaque, so only the shadow is translucent
+    painter.drawRoundedRect(inner, CARD_RADIUS, CARD_RADIUS)
+    painter.end()
+
+    # Cast the shadow through a one-item scene
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(shape)
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(CARD_SHADOW_BLUR)
+    effect.setColor(CARD_SHADOW_COLOR)
+    effect.setOffset(0, CARD_SHADOW_OFFSET)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    shadow = QPixmap(width, height)
+    shadow.fill(Qt.transparent)
+    painter = QPainter(shadow)
+    scene.render(painter, QRectF(0, 0, width, height), QRectF(0, 0, width, height))
+
+    # Keep only the shadow; the card covers everything inside its outline
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setCompositionMode(QPainter.CompositionMode_Clear)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(Qt.black)
+    painter.drawRoundedRect(inner, CARD_RADIUS, CARD_RADIUS)
+    painter.end()
+    return shadow
+
+
+# Character properties that make up the editor's base font, which every saved
+# entry records in its <body> style; they are not formatting the plain-text
+# editor would lose
+_BASE_FONT_PROPERTIES = (
+    QTextFormat.FontFamily, QTextFormat.FontFamilies,
+    QTextFormat.FontPointSize, QTextFormat.FontPixelSize,
+    QTextFormat.FontWeight, QTextFormat.FontItalic,
+)
+_BODY_STYLE = re.compile(r'<body\b[^>]*\bstyle="([^"]*)"', re.IGNORECASE)
+
+
+def _base_char_format(html):
+    # Parse the body style on its own to see the character format it produces
+    match = _BODY_STYLE.search(html)
+    if not match:
+        return QTextCharFormat()
+    document = QTextDocument()
+    document.setHtml(f'<body style="{match.group(1)}">x</body>')
+    return document.begin().begin().fragment().charFormat()
+
+
+def _without_base_font(char_format, base):
+    for prop in _BASE_FONT_PROPERTIES:
+        if char_format.property(prop) == base.property(prop):
+            char_format.clearProperty(prop)
+    if char_format.fontWeight() == QFont.Normal:
+        char_format.clearProperty(QTextFormat.FontWeight)
+    if not char_format.fontItalic():
+        char_format.clearProperty(QTextFormat.FontItalic)
+    return char_format
+
+
+def plain_text_only(html):
+    """
+    Get an entry's text if it has no formatting the plain-text editor would lose.
+
+    The HTML is parsed, the base font recorded in its <body> style is stripped
+    from every character, and the result is compared with a document rebuilt from its plain text. Any
+    block or character formatting Qt kept (images, lists, indents, bold, line
+    spacing and so on) marks the entry as rich.
+
+    Args:
+        html (str): The entry's HTML
+
+    Returns:
+        str or None: The entry's plain text, or None if it needs the rich editor
+    """
+    document = QTextDocument()
+    document.setHtml(html)
+    text = document.toPlainText()
+
+    base = _base_char_format(html)
+
+    # Collect the formats first; changing them splits and merges fragments
+    block_formats = []
+    char_formats = []
+    block = document.begin()
+    while block.isValid():
+        block_formats.append((block.position(), block.charFormat()))
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            char_formats.append((fragment.position(), fragment.length(), fragment.charFormat()))
+            it += 1
+        block = block.next()
+
+    cursor = QTextCursor(document)
+    for position, char_format in block_formats:
+        cursor.setPosition(position)
+        cursor.setBlockCharFormat(_without_base_font(char_format, base))
+    for position, length, char_format in char_formats:
+        cursor.setPosition(position)
+        cursor.setPosition(position + length, QTextCursor.KeepAnchor)
+        cursor.setCharFormat(_without_base_font(char_format, base))
+
+    rebuilt = QTextDocument()
+    rebuilt.setPlainText(text)
+    return text if rebuilt.toHtml() == document.toHtml() else None
+
+
+class _SaveSignals(QObject):
+    """Signals emitted by _SaveJob; QRunnable itself cannot carry signals."""
+    saved = pyqtSignal()
+    failed = pyqtSignal(str, str)
+
+
+class _SaveJob(QRunnable):
+    """
+    Encrypts and writes an entry and its metadata on a QThreadPool worker.
+    """
+
+    def __init__(self, username, content, enc_path, meta):
+        super().__init__()
+        self.username = username
+        self.content = content
+        self.enc_path = enc_path
+        self.meta = meta
+        self.signals = _SaveSignals()
+
+    def run(self):
+        # Encrypt and save entry content; None means the text is unchanged
+        if self.content is not None:
+            try:
+                encrypt_data(self.content, self.enc_path, self.username)
+            except Exception as e:
+                self.signals.failed.emit("Encryption Error", f"Failed to encrypt entry: {str(e)}")
+                return
+
+        # Save metadata and update the search index
+        meta_path = self.enc_path[:-len(ENC_SUFFIX)] + META_SUFFIX
+        try:
+            dump_file(meta_path, self.meta, indent=False)
+        except IOError as e:
+            self.signals.failed.emit("Error", f"Failed to save entry details: {str(e)}")
+            return
+        index_entry(self.username, self.enc_path, self.meta)
+        self.signals.saved.emit()
+
+
+class _LoadSignals(QObject):
+    """Signals emitted by _LoadJob."""
+    loaded = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class _LoadJob(QRunnable):
+    """
+    Decrypts an entry on a QThreadPool worker.
+    """
+
+    def __init__(self, username, enc_path):
+        super().__init__()
+        self.username = username
+        self.enc_path = enc_path
+        self.signals = _LoadSignals()
+
+    def run(self):
+        try:
+            content = decrypt_data(self.enc_path, self.username)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(content)
+
+
+def dropped_images(event):
+    """
+    List the image files in a drop.
+
+    Args:
+        event: The drop event containing file URLs
+
+    Returns:
+        list: Paths of the dropped files that exist and have an image extension
+    """
+    paths = [url.toLocalFile() for url in event.mimeData().urls()]
+    return [path for path in paths
+            if os.path.isfile(path) and path.lower().endswith(IMAGE_SUFFIXES)]
+
 
 class ImageDropTextEdit(QTextEdit):
     """
@@ -35,6 +414,10 @@ class ImageDropTextEdit(QTextEdit):
         """Initialize the ImageDropTextEdit with drag-and-drop enabled."""
         super().__init__()
         self.setAcceptDrops(True)
+        # Pasted or dropped text arrives as plain prose, so the document does not
+        # accumulate foreign formatting that every keystroke must re-layout.
+        # Images still go in through dropEvent and insert_image.
+        self.setAcceptRichText(False)
 
     def dragEnterEvent(self, event):
         """
@@ -53,23 +436,106 @@ class ImageDropTextEdit(QTextEdit):
         Handle drop events to insert images into the text editor.
         
         Processes dropped files and inserts valid image files into the
-        text editor with default dimensions (300x200 pixels).
+        text editor with default dimensions (300x200 pixels). A multi-file
+        drop is recorded as one undo step.
         
         Args:
             event: The drop event containing file URLs
         """
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            # Check if dropped file is a valid image format
-            if os.path.isfile(file_path) and file_path.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif")):
-                # Create image format with default dimensions
-                img_format = QTextImageFormat()
-                img_format.setName(file_path)
-                img_format.setWidth(300)
-                img_format.setHeight(200)
-                self.textCursor().insertImage(img_format)
-            else:
-                super().dropEvent(event)
+        images = dropped_images(event)
+        if images:
+            self.insert_images(images)
+        else:
+            super().dropEvent(event)
+
+    def insert_images(self, paths):
+        """
+        Insert image files at the cursor with default dimensions (300x200 pixels).
+
+        Args:
+            paths (list): Image file paths, inserted as one undo step
+        """
+        cursor = self.textCursor()
+        cursor.beginEditBlock()
+        for file_path in paths:
+            # Create image format with default dimensions
+            img_format = QTextImageFormat()
+            img_format.setName(file_path)
+            img_format.setWidth(300)
+            img_format.setHeight(200)
+            cursor.insertImage(img_format)
+        cursor.endEditBlock()
+
+    def loadResource(self, resource_type, name):
+        """
+        Load images at no more than the size they can be shown at.
+
+        Entries reference images by file path, and the document keeps every
+        image it loads for as long as it is open. Large photos are therefore
+        decoded directly at IMAGE_DISPLAY_LIMIT rather than at full
+        resolution.
+
+        Args:
+            resource_type (int): The QTextDocument resource type
+            name (QUrl): The resource name, an image file path for images
+
+        Returns:
+            The loaded resource, or None if it cannot be loaded
+        """
+        if resource_type == QTextDocument.ImageResource:
+            reader = QImageReader(name.toLocalFile() or name.toString())
+            size = reader.size()
+            if size.isValid() and (size.width() > IMAGE_DISPLAY_LIMIT.width()
+                                   or size.height() > IMAGE_DISPLAY_LIMIT.height()):
+                reader.setScaledSize(size.scaled(IMAGE_DISPLAY_LIMIT, Qt.KeepAspectRatio))
+                image = reader.read()
+                if not image.isNull():
+                    return image
+        return super().loadResource(resource_type, name)
+
+
+class ImageDropPlainTextEdit(QPlainTextEdit):
+    """
+    The editor used while an entry holds nothing but text.
+
+    QPlainTextEdit lays paragraphs out as plain lines rather than as a
+    rich-text frame tree, which keeps typing and scrolling cheap in long
+    entries. Image files dropped onto it are passed on through imagesDropped
+    so the window can switch to an ImageDropTextEdit to hold them.
+    """
+
+    imagesDropped = pyqtSignal(list)
+
+    def __init__(self):
+        """Initialize the ImageDropPlainTextEdit with drag-and-drop enabled."""
+        super().__init__()
+        self.setAcceptDrops(True)
+
+    def dragEnterEvent(self, event):
+        """
+        Handle drag enter events to accept file drops.
+
+        Args:
+            event: The drag enter event containing mime data
+        """
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragEnterEvent(event)
+
+    def dropEvent(self, event):
+        """
+        Hand dropped image files to the window, or drop anything else as text.
+
+        Args:
+            event: The drop event containing file URLs
+        """
+        images = dropped_images(event)
+        if images:
+            self.imagesDropped.emit(images)
+        else:
+            super().dropEvent(event)
+
 
 class EditorWindow(QWidget):
     """
@@ -90,14 +556,18 @@ class EditorWindow(QWidget):
     Attributes:
         username (str): The username who owns the entry
         filename (str): The filename of the entry being edited (None for new entries)
+        entry_path (str): Full path of the entry's .enc file, if known when opened
         theme (str): The UI theme (currently unused)
-        start_time (datetime): When the editing session started
+        start_time (datetime): When the entry was started; for an existing
+            entry, the start time recorded in its metadata
+        pinned (bool): Whether the entry is pinned
         entry_dir (str): Directory path for storing user entries
-        text_edit (ImageDropTextEdit): The main text editor widget
+        text_edit (ImageDropPlainTextEdit or ImageDropTextEdit): The main text
+            editor widget; plain until the entry holds an image or other formatting
         title_label (QLabel): Display label for entry title
         category_combo (QComboBox): Dropdown for entry categorization
         tags_input (QLineEdit): Input field for entry tags
-        suggestion_list (QListWidget): List of tag suggestions
+        suggestion_list (QListView): List of tag suggestions
     """
     
     def __init__(self, username, filename=None, theme="light"):
@@ -106,16 +576,22 @@ class EditorWindow(QWidget):
         
         Args:
             username (str): The username who owns the entry
-            filename (str, optional): Filename of existing entry to edit
+            filename (str, optional): Filename or full path of existing entry to edit
             theme (str, optional): UI theme preference (default: "light")
         """
         super().__init__()
         self.username = username
         self.filename = filename
+        self.entry_path = None  # Full .enc path, when the caller already knows it
+        if filename and os.path.dirname(filename):
+            self.entry_path = filename
+            self.filename = os.path.basename(filename)
         self.theme = theme
         
         # Record start time for metadata tracking
         self.start_time = datetime.datetime.now()
+        # Whether the entry is pinned; kept when the entry is saved again
+        self.pinned = False
         
         # Ensure user's entry directory exists
         self.entry_dir = os.path.join("entries", self.username)
@@ -123,6 +599,7 @@ class EditorWindow(QWidget):
 
         self.setWindowTitle("📝 QuietQuill - Editor")
         self.setMinimumSize(900, 600)
+        self._applied_scale_step = None
         self.setup_ui()
 
         # Load existing entry if filename provided
@@ -130,6 +607,8 @@ class EditorWindow(QWidget):
             self.load_entry()
 
         self.apply_dynamic_styles()
+        # Collect tag suggestions once the window has had a chance to show
+        QTimer.singleShot(0, self.populate_tag_suggestions)
 
     def setup_ui(self):
         """
@@ -158,22 +637,7 @@ class EditorWindow(QWidget):
         # Card frame with gradient background and drop shadow for modern look
         self.card_frame = QFrame()
         self.card_frame.setObjectName("editorCard")
-        # CSS-like styling for gradient background from cream to golden yellow
-        self.card_frame.setStyleSheet("""
-            QFrame#editorCard {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #fffbe7, stop:1 #ffe082);
-                border-radius: 22px;
-                padding: 36px 36px 28px 36px;
-                margin: auto;
-            }
-        """)
-        # Drop shadow effect for depth and modern appearance
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(24)
-        shadow.setColor(QColor(255, 215, 64, 80))  # Semi-transparent golden shadow
-        shadow.setOffset(0, 10)  # Slight vertical offset for depth
-        self.card_frame.setGraphicsEffect(shadow)
+        # The drop shadow is painted behind the card by paintEvent
 
         # Card layout for organizing editor components
         self.card_layout = QVBoxLayout(self.card_frame)
@@ -181,22 +645,27 @@ class EditorWindow(QWidget):
 
         # Entry title display (shows filename without extension)
         self.title_label = QLabel("Untitled Entry")
-        self.title_label.setStyleSheet("font-weight: bold; font-size: 22px; color: #b28704; background: transparent;")
+        self.title_label.setObjectName("entryTitle")
         self.title_label.setAlignment(Qt.AlignCenter)
         self.card_layout.addWidget(self.title_label)
 
-        # Main text editor with drag-and-drop image support
-        self.text_edit = ImageDropTextEdit()
-        self.text_edit.setObjectName("diaryTextEdit")
-        self.text_edit.setFont(QFont("Georgia", 16))  # Elegant serif font for writing
-        self.card_layout.addWidget(self.text_edit)
+        # Main text editor with drag-and-drop image support; it starts as a
+        # plain-text editor and is swapped for a rich one when an image goes in
+        text_edit = ImageDropPlainTextEdit()
+        text_edit.imagesDropped.connect(self._insert_dropped_images)
+        self.card_layout.addWidget(text_edit)
         
         # Information label showing word count and mood analysis
         self.info_label = QLabel("Words: 0 | Mood: Neutral 😐")
         self.info_label.setAlignment(Qt.AlignRight)
+        self.info_label.setObjectName("infoLabel")
         self.card_layout.addWidget(self.info_label)
-        # Connect text changes to update word count and mood analysis
-        self.text_edit.textChanged.connect(self.update_info_label)
+        # Word count and mood are kept per paragraph and only the edited
+        # paragraphs are re-counted; the label itself is refreshed once typing pauses
+        self._info_timer = QTimer(self)
+        self._info_timer.setSingleShot(True)
+        self._info_timer.timeout.connect(self.update_info_label)
+        self._attach_text_edit(text_edit)
 
         # Category selection dropdown
         self.category_combo = QComboBox()
@@ -217,10 +686,25 @@ class EditorWindow(QWidget):
         self.card_layout.addLayout(tag_row)
 
         # Tag suggestion list for easy tag selection
-        self.suggestion_list = QListWidget()
+        # Suggestions are a plain string model, so refilling the list is one
+        # setStringList call rather than an item per tag
+        self._tags = []      # Known tags, sorted case-insensitively
+        self._tag_counts = Counter()  # Entries carrying each tag
+        self._tag_range = None  # (prefix, first, last) of the last lookup
+        self._tag_keys = []  # Lower-cased self._tags, for prefix lookups
+        self.suggestion_model = QStringListModel(self)
+        self.suggestion_list = QListView()
+        self.suggestion_list.setModel(self.suggestion_model)
+        self.suggestion_list.setUniformItemSizes(True)
+        self.suggestion_list.setEditTriggers(QListView.NoEditTriggers)
         self.suggestion_list.setMaximumHeight(80)
         self.suggestion_list.setObjectName("suggestionList")
-        self.suggestion_list.itemClicked.connect(self.insert_tag)
+        self.suggestion_list.clicked.connect(self.insert_tag)
+        # Narrow the suggestions to the tag being typed once typing pauses
+        self._suggest_timer = QTimer(self)
+        self._suggest_timer.setSingleShot(True)
+        self._suggest_timer.timeout.connect(self.filter_tag_suggestions)
+        self.tags_input.textChanged.connect(lambda: self._suggest_timer.start(80))
         self.card_layout.addWidget(QLabel("Suggestions:"))
         self.card_layout.addWidget(self.suggestion_list)
 
@@ -235,37 +719,78 @@ class EditorWindow(QWidget):
         img_btn.clicked.connect(self.insert_image)
         self.pin_btn = QPushButton("📌\nPin/Unpin")
         self.pin_btn.clicked.connect(self.toggle_pin)
-        save_btn = QPushButton("💾\nSave")
-        save_btn.clicked.connect(self.save_entry)
+        self.save_btn = QPushButton("💾\nSave")
+        self.save_btn.clicked.connect(self.save_entry)
 
-        # Apply consistent styling to all buttons
-        for btn in [emoji_btn, img_btn, self.pin_btn, save_btn]:
+        # Apply consistent sizing to all buttons; they are styled as #editorBtn
+        for btn in [emoji_btn, img_btn, self.pin_btn, self.save_btn]:
+            btn.setObjectName("editorBtn")
             btn.setMinimumHeight(60)
             btn.setMaximumHeight(70)
             btn.setMinimumWidth(90)
             btn.setMaximumWidth(110)
             btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-            btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 15px;
-                    font-weight: bold;
-                    padding: 8px 6px;
-                    border-radius: 14px;
-                    background-color: #ffd54f;
-                    color: #795548;
-                    border: none;
-                    text-align: center;
-                }
-                QPushButton:hover {
-                    background-color: #ffe082;
-                }
-            """)
             button_row.addWidget(btn)
 
         self.card_layout.addLayout(button_row)
         self.main_layout.addWidget(self.card_frame, alignment=Qt.AlignHCenter)
         self.main_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         self.setLayout(self.main_layout)
+        self._restyle_timer = QTimer(self)
+        self._restyle_timer.setSingleShot(True)
+        self._restyle_timer.timeout.connect(self.apply_dynamic_styles)
+
+    def _attach_text_edit(self, text_edit):
+        """
+        Make a widget the entry's text editor and start counting its contents.
+
+        Args:
+            text_edit (ImageDropPlainTextEdit or ImageDropTextEdit): The new,
+                still empty editor
+        """
+        text_edit.setObjectName("diaryTextEdit")
+        text_edit.setFont(QFont("Georgia", 16))  # Elegant serif font for writing
+        self._block_stats = [(0, 0)]  # (words, score) for each block of the document
+        self._word_count = 0
+        self._mood_score = 0
+        text_edit.document().contentsChange.connect(self._on_contents_change)
+        self.text_edit = text_edit
+
+    def _use_rich_editor(self):
+        """
+        Replace the plain-text editor with an ImageDropTextEdit.
+
+        Called before the first image goes into an entry. The text, cursor
+        position and read-only state carry over; the plain editor's undo
+        history does not.
+        """
+        plain = self.text_edit
+        if isinstance(plain, ImageDropTextEdit):
+            return
+        plain.document().contentsChange.disconnect(self._on_contents_change)
+        rich = ImageDropTextEdit()
+        self._attach_text_edit(rich)
+        rich.setPlainText(plain.toPlainText())
+        rich.document().setModified(plain.document().isModified())
+        rich.setReadOnly(plain.isReadOnly())
+        rich.setPlaceholderText(plain.placeholderText())
+        cursor = rich.textCursor()
+        cursor.setPosition(plain.textCursor().position())
+        rich.setTextCursor(cursor)
+        self.card_layout.replaceWidget(plain, rich)
+        if plain.hasFocus():
+            rich.setFocus()
+        plain.deleteLater()
+
+    def _insert_dropped_images(self, paths):
+        """
+        Insert images dropped onto the plain-text editor.
+
+        Args:
+            paths (list): The dropped image files
+        """
+        self._use_rich_editor()
+        self.text_edit.insert_images(paths)
 
     def resizeEvent(self, event):
         """
@@ -274,17 +799,41 @@ class EditorWindow(QWidget):
         Args:
             event: The resize event containing new window dimensions
         """
-        # Reapply styles when window is resized for responsive design
-        self.apply_dynamic_styles()
+        self.card_frame.setMaximumWidth(int(self.width() * 0.98))
+        # Coalesce a drag-resize into one restyle once the size settles
+        self._restyle_timer.start(50)
         return super().resizeEvent(event)
 
+    def paintEvent(self, event):
+        """
+        Paint the card's drop shadow behind it from the cached pixmap.
+
+        Args:
+            event: The paint event
+        """
+        super().paintEvent(event)
+        corner = CARD_RADIUS + CARD_SHADOW_BLUR
+        # The stylesheet margin leaves a gap around the painted card, so its
+        # outline is taken from the contents rect plus the padding instead
+        outline = self.card_frame.contentsRect().marginsAdded(CARD_PADDING)
+        target = outline.translated(self.card_frame.pos()).adjusted(
+            -CARD_SHADOW_BLUR, -CARD_SHADOW_BLUR,
+            CARD_SHADOW_BLUR, CARD_SHADOW_BLUR + CARD_SHADOW_OFFSET
+        )
+        painter = QPainter(self)
+        qDrawBorderPixmap(painter, target,
+                          QMargins(corner, corner, corner, corner + CARD_SHADOW_OFFSET),
+                          card_shadow_pixmap())
+        painter.end()
+
     def apply_dynamic_styles(self):
         """
         Apply responsive styling based on current window dimensions.
         
         This method calculates scaling factors and applies appropriate
         styling to all UI components to maintain visual consistency
-        across different screen sizes.
+        across different screen sizes. Stylesheets are only reapplied
+        when the scale step changes.
         """
         # Calculate scaling based on window dimensions
         w = max(self.width(), 900)
@@ -292,88 +841,14 @@ class EditorWindow(QWidget):
         scale = min(w / 1200, h / 800)
         scale = max(0.7, min(scale, 1.5))  # Clamp scale between 0.7 and 1.5
 
-        # Define color scheme for consistent theming
-        card_grad = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #fffbe7, stop:1 #ffe082)"
-        title_color = "#b28704"
-        label_color = "#795548"
-        input_bg = "#fffde7"
-        input_border = "#ffd54f"
-        input_text = "#795548"
-        list_bg = "#fffde7"
-        list_border = "#ffd54f"
-
-        # Apply base background color
-        self.setStyleSheet(f"background: #fffde7;")
         self.card_frame.setMaximumWidth(int(self.width() * 0.98))
-        
-        # Scale and style various UI components
-        self.title.setStyleSheet(f"""
-            font-size: 36px;
-            font-weight: bold;
-            color: {title_color};
-            margin-bottom: {int(8 * scale)}px;
-            background: transparent;
-        """)
-        self.title_label.setStyleSheet(f"""
-            font-size: 22px;
-            font-weight: bold;
-            color: {title_color};
-            background: transparent;
-        """)
-        self.text_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background: {input_bg};
-                color: {input_text};
-                border: 2px solid {input_border};
-                border-radius: 14px;
-                font-family: 'Georgia', 'Times New Roman', serif;
-                font-size: 17px;
-                padding: 14px;
-            }}
-        """)
-        self.info_label.setStyleSheet(f"""
-            font-size: 14px;
-            color: {label_color};
-            background: transparent;
-        """)
-        self.category_combo.setStyleSheet(f"""
-            QComboBox {{
-                background: {input_bg};
-                color: {input_text};
-                border: 2px solid {input_border};
-                border-radius: 8px;
-                font-size: 15px;
-                padding: 6px;
-            }}
-        """)
-        self.tags_input.setStyleSheet(f"""
-            QLineEdit {{
-                background: {input_bg};
-                color: {input_text};
-                border: 2px solid {input_border};
-                border-radius: 8px;
-                font-size: 15px;
-                padding: 6px;
-            }}
-        """)
-        self.suggestion_list.setStyleSheet(f"""
-            QListWidget {{
-                background: {list_bg};
-                border: 2px solid {list_border};
-                border-radius: 8px;
-                font-size: 14px;
-                color: {input_text};
-                padding: 4px;
-            }}
-        """)
-        self.card_frame.setStyleSheet(f"""
-            QFrame#editorCard {{
-                background: {card_grad};
-                border-radius: 22px;
-                padding: 36px 36px 28px 36px;
-                margin: auto;
-            }}
-        """)
+
+        scale_step = round(scale * 10)
+        if scale_step == self._applied_scale_step:
+            return
+        # One window-level stylesheet reaches every child by object name
+        self.setStyleSheet(editor_styles(scale_step))
+        self._applied_scale_step = scale_step
 
     def load_entry(self):
         """
@@ -382,30 +857,74 @@ class EditorWindow(QWidget):
         Decrypts the entry content and loads associated metadata including
         tags, category, and other entry properties. Updates the UI to
         display the loaded content.
+
+        Decryption runs on a background worker; the editor is read-only and
+        cannot be saved until the content arrives.
         """
-        enc_path = self.get_full_entry_path(self.filename)
-        try:
-            # Decrypt and load entry content
-            content = decrypt_data(enc_path)
-            self.text_edit.setHtml(content)
-            self.title_label.setText(self.filename.replace(".enc", ""))
+        enc_path = self.entry_path or self.get_full_entry_path(self.filename)
+        self.title_label.setText(self.filename[:-len(ENC_SUFFIX)])
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setPlaceholderText("Loading…")
+        self.save_btn.setEnabled(False)
+        job = _LoadJob(self.username, enc_path)
+        job.signals.loaded.connect(self._on_entry_loaded)
+        job.signals.failed.connect(self._on_load_failed)
+        QThreadPool.globalInstance().start(job)
 
+        try:
             # Load metadata if available
-            meta_path = enc_path.replace(".enc", ".meta.json")
+            meta_path = enc_path[:-len(ENC_SUFFIX)] + META_SUFFIX
             if os.path.exists(meta_path):
-                with open(meta_path, "r") as f:
-                    meta = json.load(f)
-                    # Restore tags if present
-                    if "tags" in meta:
-                        self.tags_input.setText(", ".join(meta["tags"]))
-                    # Restore category selection if present
-                    if "category" in meta:
-                        idx = self.category_combo.findText(meta["category"])
-                        if idx != -1:
-                            self.category_combo.setCurrentIndex(idx)
+                meta = load_file(meta_path)
+                # Keep the entry's original date and start time when it is saved again
+                if "start_time" in meta:
+                    try:
+                        self.start_time = datetime.datetime.strptime(meta["start_time"], "%Y-%m-%d %H:%M:%S")
+                    except ValueError:
+                        pass
+                self.pinned = meta.get("pinned", False)
+                # Restore tags if present
+                if "tags" in meta:
+                    self.tags_input.setText(", ".join(meta["tags"]))
+                # Restore category selection if present
+                if "category" in meta:
+                    idx = self.category_combo.findText(meta["category"])
+                    if idx != -1:
+                        self.category_combo.setCurrentIndex(idx)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load entry: {str(e)}")
 
+    def _on_entry_loaded(self, content):
+        """
+        Show decrypted entry content and make the editor editable again.
+
+        Args:
+            content (str): The entry's HTML
+        """
+        text = plain_text_only(content)
+        if text is None:
+            self._use_rich_editor()
+            self.text_edit.setHtml(content)
+        else:
+            # Nothing but text, which the plain-text editor shows as is
+            self.text_edit.setPlainText(text)
+        self._finish_loading()
+
+    def _on_load_failed(self, message):
+        """
+        Report an entry that could not be decrypted.
+
+        Args:
+            message (str): What went wrong
+        """
+        self._finish_loading()
+        QMessageBox.critical(self, "Error", f"Failed to load entry: {message}")
+
+    def _finish_loading(self):
+        self.text_edit.setPlaceholderText("")
+        self.text_edit.setReadOnly(False)
+        self.save_btn.setEnabled(True)
+
     def insert_emoji(self):
         """
         Insert an emoji into the text editor at the current cursor position.
@@ -438,6 +957,7 @@ class EditorWindow(QWidget):
                     img_format.setName(file_path)
                     img_format.setWidth(width)
                     img_format.setHeight(height)
+                    self._use_rich_editor()
                     cursor = self.text_edit.textCursor()
                     cursor.insertImage(img_format)
 
@@ -451,9 +971,18 @@ class EditorWindow(QWidget):
         3. Creates directory structure based on date
         4. Encrypts and saves the entry content
         5. Saves metadata including tags, category, and timestamps
-        6. Provides user feedback and closes the editor
+        6. Updates the search index with the new metadata
+        7. Provides user feedback and closes the editor
+
+        Steps 4 to 6 run on a background worker so the window keeps
+        repainting while the key is derived and the entry is encrypted.
+        An existing entry whose text was not edited is not re-serialised or
+        re-encrypted; only its metadata is written.
         """
-        content = self.text_edit.toHtml()
+        document = self.text_edit.document()
+        content = None
+        if document.isModified() or not self.entry_path:
+            content = document.toHtml()
 
         # Handle new entry title input
         if not self.filename:
@@ -465,45 +994,62 @@ class EditorWindow(QWidget):
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
             self.filename = f"{timestamp}_{title.strip().replace(' ', '_')}.enc"
 
-        # Create directory structure by year/month for organization
-        year = self.start_time.strftime("%Y")
-        month = self.start_time.strftime("%m")
-        save_dir = os.path.join(self.entry_dir, year, month)
-        os.makedirs(save_dir, exist_ok=True)
-        enc_path = os.path.join(save_dir, self.filename)
-
-        # Encrypt and save entry content
-        try:
-            encrypt_data(content, enc_path, self.username)
-        except TypeError:
-            # Backward compatibility for older encryption function signature
-            encrypt_data(content, enc_path)
-        except Exception as e:
-            QMessageBox.critical(self, "Encryption Error", f"Failed to encrypt entry: {str(e)}")
-            return
+        if self.entry_path:
+            # Existing entries are saved back in place
+            enc_path = self.entry_path
+        else:
+            # Create directory structure by year/month for organization
+            year = self.start_time.strftime("%Y")
+            month = self.start_time.strftime("%m")
+            save_dir = os.path.join(self.entry_dir, year, month)
+            os.makedirs(save_dir, exist_ok=True)
+            enc_path = os.path.join(save_dir, self.filename)
 
-        # Prepare and save metadata
+        # Prepare metadata
         tags = [t.strip() for t in self.tags_input.text().split(",") if t.strip()]
         category = self.category_combo.currentText()
         meta = {
             "username": self.username,
             "filename": self.filename,
-            "title": self.filename.replace(".enc", ""),
+            "title": self.filename[:-len(ENC_SUFFIX)],
+            "date": self.start_time.strftime("%Y-%m-%d"),
             "start_time": self.start_time.strftime("%Y-%m-%d %H:%M:%S"),
             "end_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "tags": tags,
             "category": category
         }
-        meta_path = enc_path.replace(".enc", ".meta.json")
-        with open(meta_path, "w") as f:
-            json.dump(meta, f, indent=2)
+        if self.pinned:
+            meta["pinned"] = True
+        add_search_fields(meta)
+
+        # Encrypt and write the entry off the GUI thread
+        self.save_btn.setEnabled(False)
+        self.save_btn.setText("💾\nSaving…")
+        job = _SaveJob(self.username, content, enc_path, meta)
+        job.signals.saved.connect(self._on_saved)
+        job.signals.failed.connect(self._on_save_failed)
+        QThreadPool.globalInstance().start(job)
 
+    def _on_saved(self):
+        """Report a finished save and close the editor."""
         QMessageBox.information(self, "Saved", "Entry saved successfully.")
         self.close()
 
+    def _on_save_failed(self, title, message):
+        """
+        Report a failed save and let the user try again.
+
+        Args:
+            title (str): The message box title
+            message (str): What went wrong
+        """
+        self.save_btn.setEnabled(True)
+        self.save_btn.setText("💾\nSave")
+        QMessageBox.critical(self, title, message)
+
     def get_full_entry_path(self, filename):
         """
-        Find the full path of an entry file by searching the user's directory.
+        Find the full path of an entry file in the user's directory.
         
         Args:
             filename (str): The filename to search for
@@ -514,34 +1060,59 @@ class EditorWindow(QWidget):
         Raises:
             FileNotFoundError: If the file is not found in any subdirectory
         """
-        # Search recursively through user's entry directory
-        for root, _, files in os.walk(self.entry_dir):
-            if filename in files:
-                return os.path.join(root, filename)
-        raise FileNotFoundError(f"File '{filename}' not found.")
+        # Check the year/month directory named by the file first, then search
+        path = locate_entry_file(self.entry_dir, filename)
+        if path is None:
+            raise FileNotFoundError(f"File '{filename}' not found.")
+        return path
     
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """
+        Re-count the paragraphs touched by an edit.
+
+        Blocks before the edit are unchanged and blocks after it only shift, so
+        the cached stats are spliced: the old entries for the edited range are
+        replaced by fresh counts for the blocks now covering it.
+
+        Args:
+            position (int): Where the change starts
+            chars_removed (int): Number of characters removed
+            chars_added (int): Number of characters added
+        """
+        doc = self.text_edit.document()
+        first = doc.findBlock(position).blockNumber()
+        last = doc.findBlock(min(position + chars_added, doc.characterCount() - 1)).blockNumber()
+        old_last = last - (doc.blockCount() - len(self._block_stats))
+
+        if first < 0 or old_last < first or old_last >= len(self._block_stats):
+            # Not a contiguous edit we can splice; count the whole document
+            first, old_last, last = 0, len(self._block_stats) - 1, doc.blockCount() - 1
+
+        new_stats = []
+        block = doc.findBlockByNumber(first)
+        for _ in range(first, last + 1):
+            new_stats.append(block_stats(block.text()))
+            block = block.next()
+
+        for words, score in self._block_stats[first:old_last + 1]:
+            self._word_count -= words
+            self._mood_score -= score
+        for words, score in new_stats:
+            self._word_count += words
+            self._mood_score += score
+        self._block_stats[first:old_last + 1] = new_stats
+        self._info_timer.start(150)
+
     def update_info_label(self):
         """
         Update the information label with word count and mood analysis.
         
         This method performs basic sentiment analysis by counting positive
         and negative words in the text and displays the result along with
-        the word count.
+        the word count. Both totals are maintained by _on_contents_change.
         """
-        text = self.text_edit.toPlainText()
-        word_count = len(text.strip().split())
-
-        # Simple sentiment analysis using predefined word lists
-        happy_words = {"happy", "joy", "excited", "love", "grateful", "awesome", "smile"}
-        sad_words = {"sad", "tired", "angry", "depressed", "cry", "lonely", "hate"}
-
-        # Calculate sentiment score
-        score = 0
-        for word in text.lower().split():
-            if word in happy_words:
-                score += 1
-            elif word in sad_words:
-                score -= 1
+        word_count = self._word_count
+        score = self._mood_score
 
         # Determine mood based on sentiment score
         if score > 0:
@@ -557,40 +1128,66 @@ class EditorWindow(QWidget):
         """
         Populate the tag suggestions list with tags from existing entries.
         
-        Scans all existing entries to collect unique tags and displays
-        them in the suggestions list for easy selection.
-        """
-        tag_set = set()
-        # Search through all metadata files to collect tags
-        for root, _, files in os.walk(self.entry_dir):
-            for file in files:
-                if file.endswith(".meta.json"):
-                    try:
-                        with open(os.path.join(root, file), "r") as f:
-                            meta = json.load(f)
-                            tags = meta.get("tags", [])
-                            for tag in tags:
-                                tag_set.add(tag)
-                    except:
-                        # Skip corrupted metadata files
-                        continue
+        Reads how often each tag is used on existing entries from the search
+        index and displays the tags in the suggestions list for easy
+        selection. Without the index, metadata files are scanned instead,
+        with unchanged ones served from the shared metadata cache.
+        """
+        counts = tag_counts(self.username, self.entry_dir)
+        if counts is None:
+            counts = Counter()
+            # Search through all metadata files to collect tags
+            meta_entries = [entry for entry in iter_entry_files(self.entry_dir)
+                            if entry.name.endswith(META_SUFFIX)]
+            for meta in shared_cache(self.entry_dir).load_all(meta_entries):
+                # Corrupted metadata files come back as None and are skipped
+                if meta is not None:
+                    counts.update(meta.get("tags", []))
         
-        # Populate suggestions list with sorted unique tags
-        self.suggestion_list.clear()
-        for tag in sorted(tag_set):
-            item = QListWidgetItem(tag)
-            self.suggestion_list.addItem(item)
+        # Keep the unique tags sorted for prefix lookups
+        self._tag_counts = counts
+        self._tags = sorted(counts, key=lambda tag: (tag.lower(), tag))
+        self._tag_keys = [tag.lower() for tag in self._tags]
+        self._tag_range = None
+        self.filter_tag_suggestions()
 
-    def insert_tag(self, item):
+    def filter_tag_suggestions(self):
+        """
+        Show the most used known tags that start with the tag being typed.
+
+        The tag after the last comma in the tags input is matched
+        case-insensitively with a binary search over the sorted tag list,
+        and the TAG_SUGGESTION_LIMIT matches used on the most entries are
+        listed, most used first. When the typed tag extends the previous
+        one, only the previous match range is searched.
+        """
+        prefix = self.tags_input.text().rsplit(",", 1)[-1].strip().lower()
+        lo, hi = 0, len(self._tag_keys)
+        if self._tag_range is not None and prefix.startswith(self._tag_range[0]):
+            lo, hi = self._tag_range[1:]
+        first = bisect_left(self._tag_keys, prefix, lo, hi)
+        last = bisect_left(self._tag_keys, prefix + "\U0010ffff", first, hi)
+        self._tag_range = (prefix, first, last)
+        counts = self._tag_counts
+        top = heapq.nsmallest(TAG_SUGGESTION_LIMIT, self._tags[first:last],
+                              key=lambda tag: (-counts[tag], tag.lower(), tag))
+        self.suggestion_model.setStringList(top)
+
+    def insert_tag(self, index):
         """
         Insert a selected tag from the suggestions list into the tags input.
+
+        A partly typed tag that the selection completes is replaced by it.
         
         Args:
-            item (QListWidgetItem): The selected tag item from the suggestions list
+            index (QModelIndex): The selected tag in the suggestions list
         """
-        tag = item.text()
+        tag = index.data()
         current_tags = self.tags_input.text()
         tag_list = [t.strip() for t in current_tags.split(",") if t.strip()]
+        typed = current_tags.rsplit(",", 1)[-1].strip()
+        if typed and typed != tag and tag.lower().startswith(typed.lower()):
+            tag_list.pop()
         
         # Add tag only if not already present
         if tag not in tag_list:
@@ -599,71 +1196,38 @@ class EditorWindow(QWidget):
 
     def toggle_pin(self):
         """
-        Toggle the pin status of the currently selected entry.
-        
-        This method updates the metadata to mark an entry as pinned or unpinned,
-        which affects its display order in entry lists.
+        Toggle the pin status of the open entry.
+
+        The flag is written to the entry's metadata straight away through the
+        shared metadata cache, so windows listing entries see it without parsing
+        the file again. A new entry has to be saved before it can be pinned.
         """
-        selected = self.entry_list.currentItem()
-        if not selected:
-            QMessageBox.warning(self, "No Entry", "Select an entry to pin/unpin.")
+        if not self.filename:
+            QMessageBox.warning(self, "No Entry", "Save the entry before pinning it.")
             return
 
         # Get entry path and metadata
-        enc_path = selected.data(Qt.UserRole)
-        meta_path = enc_path.replace(".enc", ".meta.json")
+        try:
+            enc_path = self.entry_path or self.get_full_entry_path(self.filename)
+        except FileNotFoundError:
+            QMessageBox.warning(self, "No Entry", "Save the entry before pinning it.")
+            return
+        meta_path = enc_path[:-len(ENC_SUFFIX)] + META_SUFFIX
 
         if os.path.exists(meta_path):
-            # Load existing metadata
-            with open(meta_path, "r") as f:
-                meta = json.load(f)
+            try:
+                # Load existing metadata; copied because the cached dict is shared
+                meta_cache = shared_cache(self.entry_dir)
+                meta = dict(meta_cache.load(meta_path))
 
-            # Toggle pin status
-            meta["pinned"] = not meta.get("pinned", False)
+                # Toggle pin status
+                meta["pinned"] = not meta.get("pinned", False)
 
-            # Save updated metadata
-            with open(meta_path, "w") as f:
-                json.dump(meta, f, indent=2)
+                # Save updated metadata
+                meta_cache.write(meta_path, meta)
+            except (json.JSONDecodeError, IOError) as e:
+                QMessageBox.critical(self, "Error", f"Failed to update entry: {str(e)}")
+                return
 
+            self.pinned = meta["pinned"]
             QMessageBox.information(self, "Updated", f"{'Pinned' if meta['pinned'] else 'Unpinned'} successfully.")
-            self.load_entries()
-    
-    def load_entries(self):
-        """
-        Load and display all entries for the current user.
-        
-        Scans the user's entry directory and populates the entry list
-        with entries, showing pinned entries first followed by others
-        in alphabetical order.
-        """
-        self.entry_list.clear()
-        entries = []
-
-        # Collect all entries with their metadata
-        for root, _, files in os.walk(os.path.join("entries", self.username)):
-            for file in files:
-                if file.endswith(".enc"):
-                    enc_path = os.path.join(root, file)
-                    meta_path = enc_path.replace(".enc", ".meta.json")
-                    pinned = False
-                    title = file.replace(".enc", "")
-                    
-                    # Load metadata if available
-                    if os.path.exists(meta_path):
-                        with open(meta_path, "r") as f:
-                            meta = json.load(f)
-                            title = meta.get("title", title)
-                            pinned = meta.get("pinned", False)
-                    entries.append((pinned, title, enc_path))
-
-        # Sort entries: pinned first, then alphabetically
-        entries.sort(key=lambda x: (not x[0], x[1].lower()))
-
-        # Add entries to the list widget
-        for pinned, title, path in entries:
-            display_text = f"📌 {title}" if pinned else title
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.UserRole, path)
-            self.entry_list.addItem(item)
-
-
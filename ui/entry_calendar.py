@@ -9,7 +9,30 @@ for that specific day. Multiple entries per day are supported with a list dialog
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QCalendarWidget, QMessageBox, QListWidget, QDialog, QDialogButtonBox
 from PyQt5.QtCore import QDate, Qt
 from PyQt5.QtGui import QTextCharFormat, QColor
-import os, json
+import os
+from utils.entries import entry_date, iter_meta_files_between
+from utils.meta_cache import shared_cache
+
+
+def parse_date(date_str):
+    """
+    Convert a "yyyy-MM-dd" string to a QDate.
+
+    The format is fixed, so the fields are split out and passed to QDate
+    directly rather than going through Qt's general date parser.
+
+    Args:
+        date_str (str): The date to convert
+
+    Returns:
+        QDate: The date, or an invalid QDate if the string is malformed
+    """
+    try:
+        year, month, day = date_str.split("-")
+        return QDate(int(year), int(month), int(day))
+    except ValueError:
+        return QDate()
+
 
 class EntryCalendarWindow(QWidget):
     """
@@ -26,6 +49,8 @@ class EntryCalendarWindow(QWidget):
         username (str): The username whose entries are being displayed
         entry_dir (str): Path to the directory containing user's entries
         calendar (QCalendarWidget): The main calendar widget for date selection
+        _entries_by_date (dict): Entry titles keyed by "yyyy-MM-dd" date, for
+            the month listed last
     """
     
     def __init__(self, username):
@@ -43,9 +68,12 @@ class EntryCalendarWindow(QWidget):
         # Construct path to user's entries directory
         self.entry_dir = os.path.join("entries", username)
         
-        # Initialize UI and apply entry date markings
+        # Entry titles by date, for the month listed last
+        self._entries_by_date = {}
+
+        # Initialize UI and mark the entries of the month shown first
         self.setup_ui()
-        self.mark_entry_dates()
+        self.mark_entry_dates(self.calendar.yearShown(), self.calendar.monthShown())
 
     def setup_ui(self):
         """
@@ -60,63 +88,92 @@ class EntryCalendarWindow(QWidget):
         self.calendar = QCalendarWidget()
         # Connect calendar date clicks to entry information display
         self.calendar.clicked.connect(self.show_entry_info)
+        # List and mark each month's entries as the user pages to it
+        self.calendar.currentPageChanged.connect(self.mark_entry_dates)
         layout.addWidget(self.calendar)
         
         self.setLayout(layout)
 
-    def mark_entry_dates(self):
+    def _load_month(self, year, month):
+        """
+        List the entries dated within one month, grouped by date.
+
+        Only the metadata files that can belong to the month are visited, via
+        iter_meta_files_between. They are read through the user's persisted
+        metadata cache, which is checked against each file's size and
+        modification time, so only files added or changed since the cache was
+        written are parsed, on a thread pool.
+
+        Args:
+            year (int): The month's year
+            month (int): The month, 1 to 12
+
+        Returns:
+            dict: Entry titles keyed by "yyyy-MM-dd" date
+        """
+        entries_by_date = {}
+        prefix = f"{year:04d}-{month:02d}"
+        meta_cache = shared_cache(self.entry_dir)
+        meta_entries = list(iter_meta_files_between(self.entry_dir, f"{prefix}-01", f"{prefix}-31"))
+
+        # Unchanged files come from the cache; the rest are parsed concurrently
+        for entry, meta in zip(meta_entries, meta_cache.load_all(meta_entries)):
+            if meta is None:
+                # Skip corrupted or invalid metadata files
+                continue
+            date_str = entry_date(meta)
+            if date_str.startswith(prefix):
+                # Use entry title or filename as fallback
+                entries_by_date.setdefault(date_str, []).append(meta.get("title", entry.name))
+
+        # Persist newly parsed metadata so the next window starts warm
+        meta_cache.save()
+        return entries_by_date
+
+    def mark_entry_dates(self, year, month):
         """
         Mark calendar dates that have journal entries with visual highlighting.
-        
-        This method:
-        1. Scans the user's entries directory for metadata files
-        2. Extracts dates from entry metadata
-        3. Applies blue background highlighting to dates with entries
-        4. Handles file parsing errors gracefully
+
+        Called for the month on show and whenever the calendar moves to another
+        month, so only months the user actually views are scanned. The month is
+        listed again each time, so entries saved or deleted while the calendar is
+        open show up; the shared metadata cache keeps that to a directory
+        listing and a stat per file.
+
+        Args:
+            year (int): The year shown
+            month (int): The month shown, 1 to 12
         """
-        # Check if user has entries directory
-        if not os.path.isdir(self.entry_dir):
-            return
-        
-        # Set to store unique dates with entries (avoids duplicates)
-        dates_with_entries = set()
-        
-        # Scan all metadata files in the entries directory
-        for file in os.listdir(self.entry_dir):
-            if file.endswith(".meta.json"):
-                try:
-                    # Parse metadata file to extract date information
-                    with open(os.path.join(self.entry_dir, file)) as f:
-                        meta = json.load(f)
-                        date_str = meta.get("date")
-                        if date_str:
-                            dates_with_entries.add(date_str)
-                except Exception:
-                    # Skip corrupted or invalid metadata files
-                    continue
-        
+        self._entries_by_date = self._load_month(year, month)
+
         # Create text format for highlighting dates with entries
         fmt = QTextCharFormat()
         fmt.setBackground(QColor("#cce5ff"))  # Light blue background
         
-        # Apply highlighting to each date with entries
-        for date_str in dates_with_entries:
-            try:
-                # Convert date string to QDate object
-                qdate = QDate.fromString(date_str, "yyyy-MM-dd")
-                if qdate.isValid():
-                    # Apply highlighting format to the calendar date
+        # Convert the month's date strings to QDate objects up front
+        qdates = [parse_date(date_str) for date_str in self._entries_by_date]
+
+        # Apply highlighting to each date with entries in one batch; the calendar
+        # repaints once at the end instead of after every date
+        self.calendar.setUpdatesEnabled(False)
+        self.calendar.blockSignals(True)
+        try:
+            # A null date clears the highlights left from earlier listings
+            self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
+            for qdate in qdates:
+                if qdate.isValid():  # Skip invalid date strings
                     self.calendar.setDateTextFormat(qdate, fmt)
-            except Exception:
-                # Skip invalid date strings
-                continue
+        finally:
+            self.calendar.blockSignals(False)
+            self.calendar.setUpdatesEnabled(True)
+        self.calendar.update()
 
     def show_entry_info(self, date: QDate):
         """
         Display entry information for a selected calendar date.
         
         This method handles clicking on calendar dates by:
-        1. Finding all entries for the selected date
+        1. Listing the selected date's month again and looking the date up
         2. Displaying single entries in a message box
         3. Showing multiple entries in a list dialog
         4. Providing feedback for dates with no entries
@@ -124,28 +181,14 @@ class EntryCalendarWindow(QWidget):
         Args:
             date (QDate): The calendar date that was clicked
         """
-        # Convert QDate to string format for comparison
-        date_str = date.toString("yyyy-MM-dd")
-        entries = []
-        
         # Check if user has entries directory
         if not os.path.isdir(self.entry_dir):
             QMessageBox.information(self, "No Entries", "No entries directory found for this user.")
             return
-        
-        # Search for entries matching the selected date
-        for file in os.listdir(self.entry_dir):
-            if file.endswith(".meta.json"):
-                try:
-                    # Parse metadata file to check date and extract title
-                    with open(os.path.join(self.entry_dir, file)) as f:
-                        meta = json.load(f)
-                        if meta.get("date") == date_str:
-                            # Use entry title or filename as fallback
-                            entries.append(meta.get("title", file))
-                except Exception:
-                    # Skip corrupted or invalid metadata files
-                    continue
+
+        # List the clicked date's month afresh, then look the date up
+        self.mark_entry_dates(date.year(), date.month())
+        entries = self._entries_by_date.get(date.toString("yyyy-MM-dd"), [])
         
         # Display entries based on count
         if entries:
@@ -12,9 +12,9 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QFont
-import sqlite3
-import hashlib
+from db.connection import get_conn
 from ui.dashboard import DashboardWindow
+from utils.passwords import verify_password
 
 
 class LoginWindow(QWidget):
@@ -23,7 +23,7 @@ class LoginWindow(QWidget):
     
     This window provides a login form with the following features:
     - Username and password input fields
-    - Secure password verification using SHA-256 hashing
+    - Secure password verification using Argon2 (salted SHA-256 for legacy accounts)
     - Responsive design with gradient styling and shadow effects
     - Navigation to registration window for new users
     - Database integration for user authentication
@@ -261,18 +261,14 @@ class LoginWindow(QWidget):
 
         try:
             # Database query to retrieve user credentials
-            conn = sqlite3.connect("db/users.db")
-            cursor = conn.cursor()
-            cursor.execute("SELECT password_hash, salt FROM users WHERE username = ?", (username,))
-            result = cursor.fetchone()
-            conn.close()
+            result = get_conn().execute("SELECT password_hash, salt, kdf FROM users WHERE username = ? LIMIT 1",
+                                        (username,)).fetchone()
 
             if result:
                 # Verify password using stored hash and salt
-                stored_hash, salt = result
-                input_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-                
-                if input_hash == stored_hash:
+                stored_hash, salt, kdf = result
+
+                if verify_password(username, password, stored_hash, salt, kdf):
                     # Successful authentication - open dashboard
                     print("✅ Login successful — opening Dashboard...")
                     self.dashboard = DashboardWindow(username)
@@ -9,6 +9,7 @@ over time. The mood data is persisted in JSON format for each user.
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QCalendarWidget, QInputDialog, QMessageBox, QDialog, QGridLayout, QPushButton
 import os, json
 from PyQt5.QtCore import QDate
+from utils.jsonio import dump_file, load_file
 
 class EmojiPickerDialog(QDialog):
     """
@@ -132,8 +133,7 @@ class MoodTrackerWindow(QWidget):
         """
         if os.path.exists(self.mood_file):
             try:
-                with open(self.mood_file, "r") as f:
-                    return json.load(f)
+                return load_file(self.mood_file)
             except (json.JSONDecodeError, IOError):
                 # Return empty dict if file is corrupted or unreadable
                 return {}
@@ -164,8 +164,7 @@ class MoodTrackerWindow(QWidget):
             
             # Persist mood data to JSON file
             try:
-                with open(self.mood_file, "w") as f:
-                    json.dump(self.mood_data, f, indent=2)
+                dump_file(self.mood_file, self.mood_data)
                 
                 # Provide user feedback
                 QMessageBox.information(self, "Mood Saved", f"Mood for {selected_date}: {mood}")
@@ -12,9 +12,10 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QPalette, QBrush, QLinearGradient, QColor, QFont
 from PyQt5.QtCore import Qt
 import sqlite3
-import hashlib
 import os
 import binascii
+from db.connection import get_conn, write_lock
+from utils.passwords import hash_password
 
 class RegisterWindow(QWidget):
     """
@@ -273,19 +274,17 @@ class RegisterWindow(QWidget):
             QMessageBox.warning(self, "Error", "Passwords do not match.")
             return
 
-        # Generate cryptographically secure salt for password hashing
+        # Generate cryptographically secure salt for entry key derivation
         salt = binascii.hexlify(os.urandom(16)).decode()
-        # Create secure password hash using SHA-256 with salt
-        password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
+        # Create secure password hash using Argon2 (salt is embedded in the hash)
+        password_hash, kdf = hash_password(password)
 
         try:
             # Database transaction for user creation
-            conn = sqlite3.connect("db/users.db")
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO users (username, password_hash, salt) VALUES (?, ?, ?)",
-                           (username, password_hash, salt))
-            conn.commit()
-            conn.close()
+            conn = get_conn()
+            with write_lock, conn:
+                conn.execute("INSERT INTO users (username, password_hash, salt, kdf) VALUES (?, ?, ?, ?)",
+                             (username, password_hash, salt, kdf))
 
             # Create user-specific directory for storing journal entries
             os.makedirs(f"entries/{username}", exist_ok=True)
@@ -6,7 +6,8 @@ a user's journal entries, including total entries, word counts, and activity pat
 """
 
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
-import os, json
+import os
+from utils.jsonio import load_file
 
 class StatsWindow(QWidget):
     """
@@ -73,8 +74,7 @@ class StatsWindow(QWidget):
                     meta_path = os.path.join(self.entry_dir, file)
                     
                     # Load and parse metadata file
-                    with open(meta_path) as f:
-                        meta = json.load(f)
+                    meta = load_file(meta_path)
                     
                     # Extract word count and update totals
                     word_count = meta.get("word_count", 0)
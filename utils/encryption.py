@@ -1,4 +1,3 @@
-import sqlite3
 import base64
 import hashlib
 from cryptography.fernet import Fernet
@@ -6,14 +5,18 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 import os
+from db.connection import get_conn
+from utils.fileio import write_atomic
 
 def get_user_key(username):
-    """Fetch user’s salt from DB and generate AES key using PBKDF2."""
-    conn = sqlite3.connect("db/users.db")
-    cursor = conn.cursor()
-    cursor.execute("SELECT password_hash, salt FROM users WHERE username = ?", (username,))
-    result = cursor.fetchone()
-    conn.close()
+    """Fetch user’s salt from DB and generate AES key using PBKDF2.
+
+    The key is derived from key_hash, the password hash the account had before
+    its first password change, or from password_hash if it never changed, so
+    existing entries stay readable after a new password is set.
+    """
+    result = get_conn().execute("SELECT COALESCE(key_hash, password_hash), salt FROM users "
+                                "WHERE username = ? LIMIT 1", (username,)).fetchone()
 
     if not result:
         raise ValueError("User not found.")
@@ -42,14 +45,19 @@ def decrypt_data(ciphertext: bytes, username: str) -> str:
     fernet = get_user_key(username)
     return fernet.decrypt(ciphertext).decode()
 
+# First byte of every Fernet token; base64-encoded tokens start with "g" instead
+FERNET_VERSION = b"\x80"
+
 def encrypt_data(plaintext: str, filepath: str, username: str):
     """
     Encrypts plaintext and writes to file at filepath using user's key.
+
+    The token is stored as raw bytes rather than Fernet's base64 text, which
+    makes entry files a quarter smaller. The file is replaced atomically.
     """
     fernet = get_user_key(username)
     ciphertext = fernet.encrypt(plaintext.encode())
-    with open(filepath, "wb") as f:
-        f.write(ciphertext)
+    write_atomic(filepath, base64.urlsafe_b64decode(ciphertext))
 
 def decrypt_data(filepath: str, username: str) -> str:
     """
@@ -58,4 +66,7 @@ def decrypt_data(filepath: str, username: str) -> str:
     fernet = get_user_key(username)
     with open(filepath, "rb") as f:
         ciphertext = f.read()
+    if ciphertext[:1] == FERNET_VERSION:
+        ciphertext = base64.urlsafe_b64encode(ciphertext)
+    # Files written before raw storage already hold the base64 token
     return fernet.decrypt(ciphertext).decode()
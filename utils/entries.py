@@ -0,0 +1,170 @@
+"""
+Entry Files Module
+
+This module locates journal entry files on disk for the QuietQuill application.
+Entries live under entries/<username>/<year>/<month>/ as an encrypted .enc file
+with a sibling .meta.json metadata file. Traversal uses os.scandir so file types
+come from the directory listing itself rather than one stat call per file.
+"""
+
+import os
+import re
+
+ENC_SUFFIX = ".enc"
+META_SUFFIX = ".meta.json"
+
+# Entry files are named "YYYY-MM-DD_HHMMSS_<title>" after the moment they were saved
+_DATED_NAME = re.compile(r"\d{4}-\d{2}-\d{2}_")
+
+
+def iter_entry_files(path):
+    """
+    Yield every file below a directory, depth-first.
+
+    Args:
+        path (str): The directory to scan
+
+    Yields:
+        os.DirEntry: One entry per regular file found
+    """
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories are skipped, as os.walk does
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
+
+def locate_entry_file(path, filename):
+    """
+    Find an entry file below a user's directory.
+
+    A file is normally saved in the year/month directory matching the date in
+    its name, so that location is checked first with a single stat. Files kept
+    anywhere else are found by scanning the whole tree.
+
+    Args:
+        path (str): The user's entry directory
+        filename (str): The file name to look for
+
+    Returns:
+        str or None: The full path to the file, or None if not found
+    """
+    if _DATED_NAME.match(filename):
+        candidate = os.path.join(path, filename[:4], filename[5:7], filename)
+        if os.path.isfile(candidate):
+            return candidate
+    for entry in iter_entry_files(path):
+        if entry.name == filename:
+            return entry.path
+    return None
+
+
+def _period(parent, name):
+    # Map the entries/<user>/<year>/<month> layout to "YYYY" / "YYYY-MM" keys
+    if parent == "" and len(name) == 4 and name.isdigit():
+        return name
+    if len(parent) == 4 and len(name) == 2 and name.isdigit():
+        return f"{parent}-{name}"
+    return None
+
+
+def iter_meta_files_between(path, start_date, end_date):
+    """
+    Yield the metadata files that can belong to entries dated within a range.
+
+    Year and month directories outside the range are skipped without being
+    listed; an entry is saved in the directory of the month it is dated in.
+    Every metadata file inside a listed directory is yielded, whatever date its
+    name starts with, because entries reopened by older versions were saved
+    under their original name with a later date. Files and directories that do
+    not follow the naming scheme are always included.
+
+    Args:
+        path (str): The user's entry directory
+        start_date (str): Inclusive lower bound, "yyyy-MM-dd"
+        end_date (str): Inclusive upper bound, "yyyy-MM-dd"
+
+    Yields:
+        os.DirEntry: Candidate .meta.json files; callers still check the date
+    """
+    stack = [(path, "")]
+    while stack:
+        directory, period = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            # Missing or unreadable directories are skipped, as os.walk does
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    child = _period(period, entry.name) if period is not None else None
+                    if child is None or start_date[:len(child)] <= child <= end_date[:len(child)]:
+                        stack.append((entry.path, child))
+                elif entry.name.endswith(META_SUFFIX):
+                    yield entry
+
+
+def scan_entries(path):
+    """
+    Pair each encrypted entry with its metadata file in a single sweep.
+
+    Args:
+        path (str): The user's entry directory
+
+    Returns:
+        list: (enc_entry, meta_entry) tuples of os.DirEntry objects, where
+              meta_entry is None if the entry has no metadata file
+    """
+    enc_by_stem = {}
+    meta_by_stem = {}
+    for entry in iter_entry_files(path):
+        name = entry.name
+        if name.endswith(META_SUFFIX):
+            meta_by_stem[entry.path[:-len(META_SUFFIX)]] = entry
+        elif name.endswith(ENC_SUFFIX):
+            enc_by_stem[entry.path[:-len(ENC_SUFFIX)]] = entry
+    return [(enc, meta_by_stem.get(stem)) for stem, enc in enc_by_stem.items()]
+
+
+def entry_date(meta):
+    """
+    Get an entry's date from its metadata.
+
+    Args:
+        meta (dict): Parsed .meta.json contents
+
+    Returns:
+        str: The "yyyy-MM-dd" date, taken from the start time for entries
+             saved before the date field was written
+    """
+    return meta.get("date") or meta.get("start_time", "")[:10]
+
+
+def add_search_fields(meta):
+    """
+    Store lower-cased copies of the searchable fields in entry metadata.
+
+    Searches compare against title_ci, preview_ci and tags_ci directly instead
+    of lower-casing every entry on every query.
+
+    Args:
+        meta (dict): Parsed .meta.json contents, updated in place
+
+    Returns:
+        bool: True if the fields were missing and have been added
+    """
+    if "title_ci" in meta and "preview_ci" in meta and "tags_ci" in meta:
+        return False
+    meta["title_ci"] = meta.get("title", "").lower()
+    meta["preview_ci"] = meta.get("preview", "").lower()
+    meta["tags_ci"] = [t.lower() for t in meta.get("tags", [])]
+    return True
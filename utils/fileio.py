@@ -0,0 +1,38 @@
+"""
+File Writing Module
+
+This module writes entry and metadata files for the QuietQuill application so
+that a crash or power loss never leaves a half-written file behind. Data goes to
+a temporary sibling first, is flushed to disk, and then replaces the target in
+a single rename, so readers see either the old contents or the new ones.
+"""
+
+import os
+
+TMP_SUFFIX = ".tmp"
+
+
+def write_atomic(path, data):
+    """
+    Replace a file's contents in one step.
+
+    Args:
+        path (str): The file to write
+        data (bytes): The new contents
+
+    Raises:
+        IOError: If the file cannot be written; the original is left untouched
+    """
+    tmp_path = path + TMP_SUFFIX
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,89 @@
+"""
+JSON I/O Module
+
+This module reads and writes JSON files for the QuietQuill application using
+orjson when it is installed, falling back to the standard library otherwise.
+orjson's decode errors subclass json.JSONDecodeError, so callers catch the same
+exception either way. Files are always UTF-8 and are read back as bytes.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.fileio import write_atomic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(data, indent=True):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+else:
+    loads = json.loads
+
+    def dumps(data, indent=True):
+        return json.dumps(data, indent=2 if indent else None).encode()
+
+
+def load_file(path):
+    """
+    Read and parse a JSON file.
+
+    Args:
+        path (str): The file to read
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        IOError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(path, data, indent=True):
+    """
+    Serialise a value and atomically replace a JSON file with it.
+
+    Args:
+        path (str): The file to write
+        data: The value to store
+        indent (bool): Pretty-print with two-space indentation
+
+    Raises:
+        IOError: If the file cannot be written
+    """
+    write_atomic(path, dumps(data, indent))
+
+
+def _try_load(path):
+    try:
+        return path, load_file(path)
+    except (json.JSONDecodeError, IOError):
+        return path, None
+
+
+def load_files(paths):
+    """
+    Read and parse many JSON files concurrently.
+
+    File reads release the GIL, so a thread pool overlaps the I/O for large sets.
+
+    Args:
+        paths (list): The files to read
+
+    Returns:
+        list: (path, data) tuples in input order, where data is None for
+              files that could not be read or parsed
+    """
+    if len(paths) < 2:
+        return [_try_load(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_try_load, paths))
@@ -0,0 +1,173 @@
+"""
+Metadata Cache Module
+
+This module keeps parsed .meta.json contents between runs of the QuietQuill
+application. Each cached record is keyed by the metadata file's path and checked
+against its modification time and size, so an unchanged file is never reopened
+or re-parsed. The cache is stored as entries/<username>/.meta_cache.json.
+
+A MetaCache may be shared between the GUI thread and background scan workers;
+its methods serialise access internally. shared_cache() hands every window the
+same instance for a given user, so metadata parsed by one is reused by the rest.
+"""
+
+import json
+import os
+import threading
+from functools import lru_cache
+
+from utils.jsonio import dump_file, load_file, load_files
+
+CACHE_NAME = ".meta_cache.json"
+
+
+class MetaCache:
+    """
+    A stat-validated cache of parsed entry metadata for one user.
+
+    Attributes:
+        path (str): Location of the cache file on disk
+    """
+
+    def __init__(self, entry_dir):
+        """
+        Load the cache for a user's entry directory.
+
+        Args:
+            entry_dir (str): The user's entry directory
+        """
+        self.path = os.path.join(entry_dir, CACHE_NAME)
+        self._records = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            self._records = load_file(self.path)
+        except (json.JSONDecodeError, IOError):
+            # Missing or unreadable cache just means a cold start
+            pass
+
+    def load(self, dir_entry):
+        """
+        Get the parsed metadata for a .meta.json file.
+
+        The returned dict is shared with the cache and must not be modified;
+        use write() to change an entry's metadata.
+
+        Args:
+            dir_entry (os.DirEntry or str): The metadata file, as yielded by a
+                scandir sweep, or its path
+
+        Returns:
+            dict: The parsed metadata
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON
+            IOError: If the file cannot be read
+        """
+        if isinstance(dir_entry, str):
+            path, st = dir_entry, os.stat(dir_entry)
+        else:
+            path, st = dir_entry.path, dir_entry.stat()
+        with self._lock:
+            record = self._records.get(path)
+        if record and record[0] == st.st_mtime_ns and record[1] == st.st_size:
+            return record[2]
+
+        meta = load_file(path)
+        with self._lock:
+            self._records[path] = [st.st_mtime_ns, st.st_size, meta]
+            self._dirty = True
+        return meta
+
+    def write(self, path, meta):
+        """
+        Save metadata to a .meta.json file and cache it as that file's contents.
+
+        Args:
+            path (str): The metadata file
+            meta (dict): The metadata to store
+
+        Raises:
+            IOError: If the file cannot be written
+        """
+        dump_file(path, meta, indent=False)
+        st = os.stat(path)
+        with self._lock:
+            self._records[path] = [st.st_mtime_ns, st.st_size, meta]
+            self._dirty = True
+
+    def load_all(self, dir_entries):
+        """
+        Get the parsed metadata for many .meta.json files.
+
+        Files that are not cached or have changed are parsed concurrently.
+
+        Args:
+            dir_entries (list): The metadata files, as yielded by a scandir sweep
+
+        Returns:
+            list: The parsed metadata for each file in input order, or None
+                  for files that could not be read or parsed
+        """
+        results = [None] * len(dir_entries)
+        misses = []
+        with self._lock:
+            for i, dir_entry in enumerate(dir_entries):
+                try:
+                    st = dir_entry.stat()
+                except OSError:
+                    continue
+                record = self._records.get(dir_entry.path)
+                if record and record[0] == st.st_mtime_ns and record[1] == st.st_size:
+                    results[i] = record[2]
+                else:
+                    misses.append((i, st))
+
+        loaded = load_files([dir_entries[i].path for i, _ in misses])
+        with self._lock:
+            for (i, st), (path, meta) in zip(misses, loaded):
+                if meta is not None:
+                    results[i] = meta
+                    self._records[path] = [st.st_mtime_ns, st.st_size, meta]
+                    self._dirty = True
+        return results
+
+    def prune(self, live_paths):
+        """
+        Drop records for metadata files that no longer exist.
+
+        Args:
+            live_paths (set): Paths of the metadata files seen in the latest scan
+        """
+        with self._lock:
+            stale = [path for path in self._records if path not in live_paths]
+            for path in stale:
+                del self._records[path]
+            if stale:
+                self._dirty = True
+
+    def save(self):
+        """Write the cache back to disk if anything changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                dump_file(self.path, self._records, indent=False)
+                self._dirty = False
+            except IOError:
+                # The cache is an optimisation; losing it only costs a re-parse
+                pass
+
+
+@lru_cache(maxsize=None)
+def shared_cache(entry_dir):
+    """
+    Get the process-wide metadata cache for a user's entry directory.
+
+    Args:
+        entry_dir (str): The user's entry directory
+
+    Returns:
+        MetaCache: The cache every window uses for that directory
+    """
+    return MetaCache(entry_dir)
@@ -0,0 +1,94 @@
+"""
+Password Hashing Module
+
+This module hashes and verifies account passwords for the QuietQuill application.
+New passwords are hashed with Argon2, which embeds its own salt and cost parameters
+in the stored hash. Rows created before the switch keep their salted SHA-256 hash
+and are verified on the legacy path until the password is next changed.
+
+Successful verifications are remembered in a small in-memory LRU so repeat checks
+for the same user and password skip the deliberately slow Argon2 computation.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Values stored in the users.kdf column
+KDF_ARGON2 = "argon2"
+KDF_SHA256 = "sha256"
+
+_hasher = PasswordHasher()
+
+# (username, keyed digest of the password) -> stored hash it was verified against
+_VERIFY_CACHE_SIZE = 128
+_verified = OrderedDict()
+# Per-process key so cached digests are useless outside this process
+_cache_key = os.urandom(32)
+
+
+def _cache_digest(password):
+    return hashlib.blake2b(password.encode(), digest_size=16, key=_cache_key).hexdigest()
+
+
+def hash_password(password):
+    """
+    Hash a password for storage.
+
+    Args:
+        password (str): The plaintext password
+
+    Returns:
+        tuple: (password_hash, kdf) to store in the users table
+    """
+    return _hasher.hash(password), KDF_ARGON2
+
+
+def legacy_hash(password, salt):
+    """Return the salted SHA-256 hex digest used by pre-Argon2 accounts."""
+    # Feed both parts to the hash in turn rather than building password + salt
+    digest = hashlib.sha256(password.encode())
+    digest.update(salt.encode())
+    return digest.hexdigest()
+
+
+def verify_password(username, password, stored_hash, salt, kdf=KDF_ARGON2):
+    """
+    Check a password against the hash stored for a user.
+
+    Args:
+        username (str): The account being verified
+        password (str): The plaintext password entered by the user
+        stored_hash (str): The password_hash column value
+        salt (str): The salt column value (only used by legacy rows)
+        kdf (str): The kdf column value, "argon2" or "sha256"
+
+    Returns:
+        bool: True if the password matches
+    """
+    if kdf != KDF_ARGON2:
+        return legacy_hash(password, salt) == stored_hash
+
+    key = (username, _cache_digest(password))
+    if _verified.get(key) == stored_hash:
+        _verified.move_to_end(key)
+        return True
+
+    try:
+        _hasher.verify(stored_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+    _verified[key] = stored_hash
+    if len(_verified) > _VERIFY_CACHE_SIZE:
+        _verified.popitem(last=False)
+    return True
+
+
+def invalidate(username):
+    """Forget every cached verification for a user, e.g. after a password change."""
+    for key in [k for k in _verified if k[0] == username]:
+        del _verified[key]